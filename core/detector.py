@@ -8,6 +8,7 @@ Vehicle detector module using OpenVINO
 import cv2
 import numpy as np
 import time
+from collections import deque
 from pathlib import Path
 from openvino.runtime import Core, get_version
 from threading import Lock
@@ -15,6 +16,27 @@ from typing import Tuple, Optional, Dict, Any, Union, List
 
 from config.settings import VEHICLE_CLASSES, COLORS, DEFAULT_CONF_THRESHOLD, DEFAULT_NMS_THRESHOLD
 
+def resolve_model_path(model_path):
+    """
+    Prefer an INT8-quantized sibling of an IR model when present
+
+    Looks for <stem>_int8.xml next to model_path — the output of an
+    offline quantization run (see quantize_model.py). INT8 roughly
+    doubles throughput on Intel CPU/iGPU with no API change.
+
+    Args:
+        model_path: Path to the FP32/FP16 .xml model
+
+    Returns:
+        Path: The INT8 sibling if it exists, otherwise model_path
+    """
+    model_path = Path(model_path)
+    int8_path = model_path.with_name(f"{model_path.stem}_int8.xml")
+    if int8_path.exists():
+        print(f"Using INT8 quantized model: {int8_path}")
+        return int8_path
+    return model_path
+
 class VehicleDetector:
     """
     Vehicle detector class using OpenVINO IR models
@@ -49,10 +71,16 @@ class VehicleDetector:
         self.is_async = async_mode
         self.infer_lock = Lock()
 
+        # Ring state for the submit()/poll() pipeline: request ids of
+        # in-flight inferences, oldest first
+        self._inflight = deque()
+        self._submit_id = 0
+
         # Performance metrics
         self.inference_times = []
         self.frame_count = 0
         self.fps = 0
+        self._stats_cache = (None, None)  # (frame_count, stats dict)
 
         print(f"OpenVINO version: {get_version()}")
         print(f"Initializing detector with {model_path} on {device}")
@@ -116,16 +144,17 @@ class VehicleDetector:
         Returns:
             numpy.ndarray: Preprocessed blob
         """
-        # Resize to network input size
-        blob = cv2.resize(frame, (self.input_width, self.input_height))
-
-        # Normalize [0-255] to [0-1]
-        blob = blob.astype(np.float32) / 255.0
-
-        # HWC to NCHW format
-        blob = blob.transpose(2, 0, 1)[None, ...]
-
-        return blob
+        # blobFromImage fuses the resize, the [0-255] -> [0-1] scaling
+        # and the HWC -> NCHW transpose into a single pass, and returns
+        # a contiguous float32 blob — the old transpose produced a
+        # strided view that had to be repacked again at inference time
+        return cv2.dnn.blobFromImage(
+            frame,
+            scalefactor=1.0 / 255.0,
+            size=(self.input_width, self.input_height),
+            swapRB=False,
+            crop=False
+        )
 
     def postprocess(self, frame, detections):
         """
@@ -294,6 +323,67 @@ class VehicleDetector:
 
             return detections, infer_time
 
+    def submit(self, frame):
+        """
+        Queue a frame for asynchronous inference
+
+        Use together with poll(): up to num_requests frames can be in
+        flight at once, overlapping device inference with the Python
+        side tracking and drawing of earlier frames.
+
+        Args:
+            frame (numpy.ndarray): Input frame
+        """
+        with self.infer_lock:
+            if len(self._inflight) >= self.num_requests:
+                raise RuntimeError(
+                    "All inference requests are in flight; call poll() first")
+
+            rid = self._submit_id
+            blob = self.preprocess(frame)
+            self.requests[rid].start_async({self.input_name: blob})
+            self._inflight.append(rid)
+            self._submit_id = (self._submit_id + 1) % self.num_requests
+
+    def poll(self):
+        """
+        Wait for the oldest in-flight request and return its result
+
+        Returns:
+            Tuple[numpy.ndarray, float]: (detections, infer_time_ms),
+                or (None, None) when nothing is in flight
+        """
+        with self.infer_lock:
+            if not self._inflight:
+                return None, None
+
+            rid = self._inflight.popleft()
+            start_time = time.time()
+            self.requests[rid].wait()
+            detections = self.requests[rid].get_output_tensor(0).data
+
+            infer_time = (time.time() - start_time) * 1000
+            self.inference_times.append(infer_time)
+            self.frame_count += 1
+
+            return detections, infer_time
+
+    def reset_pipeline(self):
+        """
+        Clear the async submit/poll pipeline
+
+        Waits out any requests still in flight and empties the ring so
+        the next run starts with the full request pool available.
+        """
+        with self.infer_lock:
+            while self._inflight:
+                rid = self._inflight.popleft()
+                try:
+                    self.requests[rid].wait()
+                except Exception as e:
+                    print(f"Error waiting for in-flight request {rid}: {str(e)}")
+            self._submit_id = 0
+
     def detect(self, frame):
         """
         Run detection on frame (sync or async depending on configuration)
@@ -330,26 +420,35 @@ class VehicleDetector:
         Returns:
             dict: Performance metrics
         """
+        # Stats only change when a new frame is recorded; reuse the
+        # last result instead of re-averaging the whole window
+        if self._stats_cache[0] == self.frame_count:
+            return self._stats_cache[1]
+
         if not self.inference_times:
-            return {
+            stats = {
                 "avg_inference_time": 0,
                 "fps": 0,
                 "frames_processed": 0
             }
+        else:
+            avg_time = sum(self.inference_times) / len(self.inference_times)
+            fps = 1000 / avg_time if avg_time > 0 else 0
 
-        avg_time = sum(self.inference_times) / len(self.inference_times)
-        fps = 1000 / avg_time if avg_time > 0 else 0
+            stats = {
+                "avg_inference_time": avg_time,
+                "fps": fps,
+                "frames_processed": self.frame_count
+            }
 
-        return {
-            "avg_inference_time": avg_time,
-            "fps": fps,
-            "frames_processed": self.frame_count
-        }
+        self._stats_cache = (self.frame_count, stats)
+        return stats
 
     def reset_stats(self):
         """Reset performance statistics"""
         self.inference_times = []
         self.frame_count = 0
+        self._stats_cache = (None, None)
 
     def draw_stats(self, frame):
         """
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Dict, Tuple, Optional, Union
 
+from core.tracking_kernels import segments_intersect
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
@@ -340,18 +342,12 @@ class ROIManager:
         Returns:
             bool: True if lines intersect
         """
-        # Convert to numpy for vector operations
-        p1 = np.array(p1)
-        p2 = np.array(p2)
-        q1 = np.array(q1)
-        q2 = np.array(q2)
-
-        def ccw(A, B, C):
-            """Check if three points are counter-clockwise"""
-            return (C[1] - A[1]) * (B[0] - A[0]) > (B[1] - A[1]) * (C[0] - A[0])
-
-        # Check if lines intersect
-        return ccw(p1, q1, q2) != ccw(p2, q1, q2) and ccw(p1, p2, q1) != ccw(p1, p2, q2)
+        # Scalar math in the shared kernel: the old numpy conversions
+        # cost more than the four orientation tests themselves
+        return bool(segments_intersect(
+            float(p1[0]), float(p1[1]), float(p2[0]), float(p2[1]),
+            float(q1[0]), float(q1[1]), float(q2[0]), float(q2[1])
+        ))
 
     def draw_rois(self, frame):
         """
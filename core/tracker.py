@@ -11,6 +11,7 @@ import numpy as np
 from collections import defaultdict, deque
 
 from config.settings import COLORS
+from core.tracking_kernels import iou_distance_matrices
 
 class VehicleTracker:
     """
@@ -165,19 +166,13 @@ class VehicleTracker:
             object_ids = list(self.objects.keys())
             existing_bboxes = list(self.objects.values())
 
-            # Calculate IoU and distance matrix between existing and new boxes
-            iou_matrix = np.zeros((len(existing_bboxes), len(bboxes)))
-            distance_matrix = np.zeros((len(existing_bboxes), len(bboxes)))
-
-            for i, existing_bbox in enumerate(existing_bboxes):
-                existing_center = self.get_center(existing_bbox)
-                for j, new_bbox in enumerate(bboxes):
-                    # Calculate IoU
-                    iou_matrix[i, j] = self.calculate_iou(existing_bbox, new_bbox)
-
-                    # Calculate distance
-                    new_center = self.get_center(new_bbox)
-                    distance_matrix[i, j] = self.calculate_distance(existing_center, new_center)
+            # Calculate IoU and distance matrices between existing and
+            # new boxes in one compiled pass instead of a Python loop
+            # over every pair
+            iou_matrix, distance_matrix = iou_distance_matrices(
+                np.asarray(existing_bboxes, dtype=np.float32),
+                np.asarray(bboxes, dtype=np.float32)
+            )
 
             # Create cost matrix combining IoU and distance
             # Higher IoU is better (lower cost), lower distance is better (lower cost)
@@ -0,0 +1,115 @@
+# quantize_model.py
+# -*- coding: utf-8 -*-
+
+"""
+Offline INT8 quantization for the detector model
+
+Runs NNCF post-training quantization over an OpenVINO IR model using
+frames sampled from a video file as calibration data, and writes
+<stem>_int8.xml next to the input model. The application picks the
+INT8 sibling up automatically at startup (see
+core.detector.resolve_model_path).
+
+Requires nncf: pip install nncf
+
+Usage:
+    python quantize_model.py --model data/models/nanodet-plus-m_416_openvino.xml \
+        --video sample.mp4 --frames 300
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import cv2
+
+
+def sample_blobs(video_path, input_width, input_height, count):
+    """
+    Sample evenly spaced calibration blobs from a video file
+
+    Preprocessing matches VehicleDetector.preprocess so the
+    quantization statistics see the same value distribution as
+    inference.
+
+    Args:
+        video_path (str): Path to calibration video
+        input_width (int): Model input width
+        input_height (int): Model input height
+        count (int): Number of frames to sample
+
+    Returns:
+        list: NCHW float32 blobs
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Failed to open calibration video: {video_path}")
+
+    total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) or count
+    step = max(1, total // count)
+
+    blobs = []
+    index = 0
+    while len(blobs) < count:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        if index % step == 0:
+            blobs.append(cv2.dnn.blobFromImage(
+                frame,
+                scalefactor=1.0 / 255.0,
+                size=(input_width, input_height),
+                swapRB=False,
+                crop=False
+            ))
+        index += 1
+
+    cap.release()
+
+    if not blobs:
+        raise RuntimeError("No calibration frames could be read")
+    return blobs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Quantize an OpenVINO IR detector model to INT8")
+    parser.add_argument("--model", required=True,
+                        help="Path to the FP32/FP16 .xml model")
+    parser.add_argument("--video", required=True,
+                        help="Video file providing calibration frames")
+    parser.add_argument("--frames", type=int, default=300,
+                        help="Number of calibration frames (default: 300)")
+    args = parser.parse_args()
+
+    try:
+        import nncf
+    except ImportError:
+        print("nncf is required for quantization: pip install nncf")
+        return 1
+
+    from openvino.runtime import Core, serialize
+
+    model_path = Path(args.model)
+    core = Core()
+    model = core.read_model(model_path)
+
+    input_tensor = model.input(0)
+    input_name = input_tensor.any_name
+    _, _, input_height, input_width = input_tensor.shape
+
+    print(f"Sampling {args.frames} calibration frames from {args.video}")
+    blobs = sample_blobs(args.video, input_width, input_height, args.frames)
+
+    print(f"Quantizing {model_path} with {len(blobs)} frames")
+    calibration = nncf.Dataset(blobs, lambda blob: {input_name: blob})
+    quantized = nncf.quantize(model, calibration)
+
+    out_path = model_path.with_name(f"{model_path.stem}_int8.xml")
+    serialize(quantized, str(out_path))
+    print(f"INT8 model written to {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
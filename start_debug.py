@@ -363,20 +363,25 @@ class DebugToolsInitializer:
                         QTimer.singleShot(500, self._connect_processor_signals)
                         return
 
-                    # Connect frame_processed signal ke stream_view.update_frame
+                    # Connect frame_ready signal ke stream_view.update_frame
                     try:
+                        thread = self._video_processor.processing_thread
+
                         # Pastikan tidak ada koneksi ganda
                         try:
-                            self._video_processor.processing_thread.frame_processed.disconnect()
+                            thread.frame_ready.disconnect()
                         except:
                             pass  # Ignore errors if not already connected
 
+                        # Pop the latest frame from the handoff slot
+                        def show_latest(thread=thread, view=self.stream_view):
+                            latest = thread.take_latest()
+                            if latest is not None:
+                                view.update_frame(latest[0])
+
                         # Connect dengan QueuedConnection untuk thread safety
                         from PyQt5.QtCore import Qt
-                        self._video_processor.processing_thread.frame_processed.connect(
-                            self.stream_view.update_frame,
-                            Qt.QueuedConnection
-                        )
+                        thread.frame_ready.connect(show_latest, Qt.QueuedConnection)
                         logging.info("Connected processing thread signals to stream view")
                     except Exception as e:
                         logging.error(f"Error connecting signals: {str(e)}")
@@ -159,6 +159,11 @@ class ControlPanel(QWidget):
         self.file_loop_check = QCheckBox("Loop Video")
         file_layout.addRow("", self.file_loop_check)
 
+        self.file_cache_check = QCheckBox("Cache Frames")
+        self.file_cache_check.setToolTip(
+            "Decode the file once to a disk cache so repeated runs skip decoding")
+        file_layout.addRow("", self.file_cache_check)
+
         source_layout.addRow("", self.file_options)
 
         # Apply source button
@@ -592,6 +597,7 @@ class ControlPanel(QWidget):
 
         if source_type == "file":
             options["loop"] = self.file_loop_check.isChecked()
+            options["cache_frames"] = self.file_cache_check.isChecked()
         elif source_type == "rtsp":
             options["reconnect_interval"] = self.rtsp_reconnect_spin.value()
         elif source_type == "webcam":
@@ -673,6 +679,7 @@ class ControlPanel(QWidget):
         # Source-specific options
         if preset["source"]["type"] == "file":
             preset["source"]["options"]["loop"] = self.file_loop_check.isChecked()
+            preset["source"]["options"]["cache_frames"] = self.file_cache_check.isChecked()
         elif preset["source"]["type"] == "rtsp":
             preset["source"]["options"]["reconnect_interval"] = self.rtsp_reconnect_spin.value()
 
@@ -775,6 +782,7 @@ class ControlPanel(QWidget):
             options = source.get("options", {})
             if source_type == "file":
                 self.file_loop_check.setChecked(options.get("loop", False))
+                self.file_cache_check.setChecked(options.get("cache_frames", False))
             elif source_type == "rtsp":
                 self.rtsp_reconnect_spin.setValue(options.get("reconnect_interval", 5))
 
@@ -851,10 +859,11 @@ class ControlPanel(QWidget):
         Args:
             results (dict): Processing results
         """
-        # Performance stats
-        perf = results.get("performance", {})
-        self.fps_label.setText(f"{perf.get('fps', 0):.1f}")
-        self.inf_time_label.setText(f"{perf.get('avg_inference_time', 0):.1f} ms")
+        # Performance stats (None when throttled; keep current labels)
+        perf = results.get("performance")
+        if perf is not None:
+            self.fps_label.setText(f"{perf.get('fps', 0):.1f}")
+            self.inf_time_label.setText(f"{perf.get('avg_inference_time', 0):.1f} ms")
 
         # Detection stats
         detection = results.get("detection", {})
@@ -886,6 +895,7 @@ class ControlPanel(QWidget):
         self.start_btn.setEnabled(not is_processing)
         self.stop_btn.setEnabled(is_processing)
         self.pause_btn.setEnabled(is_processing)
+        self.update_status("Processing" if is_processing else "Idle")
 
         if not is_processing:
             self.pause_btn.setChecked(False)
@@ -5,10 +5,13 @@
 Main Window component for Vehicle Counter application
 Provides the main application window with menus, toolbars, and layout management
 """
+import importlib
+import json
 import logging
 import os
 import sys
 import traceback
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
@@ -16,10 +19,13 @@ from PyQt5.QtWidgets import (
     QMainWindow, QAction, QToolBar, QMenuBar, QStatusBar, QDockWidget,
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QFileDialog,
     QMessageBox, QLabel, QDialog, QDialogButtonBox, QFormLayout,
-    QLineEdit, QTextEdit, QApplication, QShortcut, QMenu
+    QLineEdit, QTextEdit, QApplication, QMenu, QActionGroup
 )
-from PyQt5.QtCore import Qt, QSize, QSettings, pyqtSignal, QTimer
-from PyQt5.QtGui import QIcon, QKeySequence
+from PyQt5.QtCore import (
+    Qt, QSize, QSettings, pyqtSignal, pyqtSlot, QTimer, QObject, QThread,
+    QEvent, QSignalBlocker
+)
+from PyQt5.QtGui import QIcon
 
 from ui.components.stream_view import VideoStreamView
 from ui.components.control_panel import ControlPanel
@@ -32,6 +38,22 @@ from config.settings import VERSION
 # Setup logger
 logger = get_logger(__name__)
 
+# File dialog filters
+_VIDEO_FILTER = "Video Files (*.mp4 *.avi *.mkv *.mov);;All Files (*.*)"
+_JSON_FILTER = "JSON Files (*.json);;All Files (*.*)"
+
+@lru_cache(maxsize=256)
+def _path_stem(path):
+    """Get a path's stem without re-allocating a Path per call
+
+    Args:
+        path: File path string
+
+    Returns:
+        str: Final component without its suffix
+    """
+    return Path(path).stem
+
 try:
     from direct_video_display import DirectVideoDisplay
 except ImportError:
@@ -100,11 +122,68 @@ class AboutDialog(QDialog):
         layout.addWidget(button_box)
 
 
+class SettingsWriter(QObject):
+    """Writes QSettings values on a background thread
+
+    QSettings.setValue serializes to disk (or the Windows registry)
+    synchronously, so writes issued from the GUI thread can stutter the
+    UI. This object lives on a dedicated QThread and receives key/value
+    pairs via queued signals; it owns its own QSettings instance created
+    lazily inside the worker thread.
+    """
+
+    def __init__(self, organization, application):
+        """Initialize settings writer
+
+        Args:
+            organization: QSettings organization name
+            application: QSettings application name
+        """
+        super().__init__()
+        self._organization = organization
+        self._application = application
+        self._settings = None
+
+    def _qsettings(self):
+        """Get the thread-local QSettings instance, creating it on first use"""
+        if self._settings is None:
+            self._settings = QSettings(self._organization, self._application)
+        return self._settings
+
+    @pyqtSlot(str, object)
+    def write(self, key, value):
+        """Write a settings value
+
+        Args:
+            key: Settings key
+            value: Value to store
+        """
+        self._qsettings().setValue(key, value)
+
+    @pyqtSlot()
+    def flush(self):
+        """Flush pending writes to permanent storage"""
+        if self._settings is not None:
+            self._settings.sync()
+
+    @pyqtSlot()
+    def stop(self):
+        """Flush and stop the worker thread's event loop
+
+        Queued after the final writes so everything lands before exit.
+        """
+        self.flush()
+        QThread.currentThread().quit()
+
+
 class MainWindow(QMainWindow):
     """Main application window"""
 
     # Signals
     preset_loaded = pyqtSignal(dict)  # preset data
+    write_setting = pyqtSignal(str, object)  # key, value
+    flush_settings = pyqtSignal()
+    stop_settings_writer = pyqtSignal()
 
     def __init__(self):
         """Initialize main window"""
@@ -112,9 +191,38 @@ class MainWindow(QMainWindow):
 
         # State initialization
         self.settings = QSettings("VehicleCounter", "Application")
+        self._settings_cache = {}  # last written value per key, to skip no-op writes
+
+        # One-time migration: RecentPresets used to be stored as a QSettings
+        # list, which marshals every element through QVariant on each write
+        old_recent = self.settings.value("RecentPresets")
+        if old_recent is not None:
+            if not isinstance(old_recent, list):
+                old_recent = [old_recent] if old_recent else []
+            self.settings.setValue("RecentPresetsJson", json.dumps(old_recent))
+            self.settings.remove("RecentPresets")
+
+        # In-memory mirror of the recent presets list; after this read
+        # the settings key is write-only
+        self._recent_presets = self._get_recent()
+
         self.preset_manager = get_preset_manager()
         self._video_processor = None
 
+        # Cached directory strings for file dialogs
+        self._home_str = str(Path.home())
+        self._presets_dir_str = str(self.preset_manager.presets_dir)
+
+        # Background writer so QSettings disk I/O never blocks the GUI
+        # thread; reads still go through self.settings directly
+        self._settings_thread = QThread(self)
+        self._settings_writer = SettingsWriter("VehicleCounter", "Application")
+        self._settings_writer.moveToThread(self._settings_thread)
+        self.write_setting.connect(self._settings_writer.write, Qt.QueuedConnection)
+        self.flush_settings.connect(self._settings_writer.flush, Qt.QueuedConnection)
+        self.stop_settings_writer.connect(self._settings_writer.stop, Qt.QueuedConnection)
+        self._settings_thread.start()
+
         # UI components (initialized in init_ui)
         self.central_widget = None
         self.main_layout = None
@@ -132,13 +240,41 @@ class MainWindow(QMainWindow):
         self.restore_window_state()
         self.connect_signals()
 
-        # Auto-save timer (every 5 minutes)
+        # Auto-save timer; the callback is a no-op unless something
+        # changed since the last save, so idle sessions never write
+        self._dirty = False
         self.autosave_timer = QTimer(self)
         self.autosave_timer.timeout.connect(self.auto_save_state)
         self.autosave_timer.start(300000)  # 5 minutes in milliseconds
 
+        # Coalesce interactive geometry changes into one deferred write
+        # burst instead of saving on every resize/move/splitter drag
+        self._dirty_keys = set()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(1000)
+        self._save_timer.timeout.connect(self._flush_dirty)
+        self.main_splitter.splitterMoved.connect(self._on_splitter_moved)
+
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_dirty)
+
+        # Warm the heavyweight processor import off the GUI thread so the
+        # first Start click doesn't stall while OpenCV/OpenVINO load
+        self._processor_future = None
+        QTimer.singleShot(0, self._prewarm_processor_import)
+
         logger.info("Main window initialized")
 
+    def _prewarm_processor_import(self):
+        """Import the video processor module in a background thread"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._processor_future = executor.submit(importlib.import_module, "ui.gui_app")
+        executor.shutdown(wait=False)
+
     def init_ui(self):
         """Initialize user interface"""
         # Window properties
@@ -174,72 +310,116 @@ class MainWindow(QMainWindow):
         self.control_panel = ControlPanel()
         self.main_splitter.addWidget(self.control_panel)
 
+        # Cache source combo indices so source switching skips the
+        # findData linear scan; rebuilt if the combo model ever changes
+        combo = self.control_panel.source_type_combo
+        self._rebuild_source_index()
+        combo.model().rowsInserted.connect(self._rebuild_source_index)
+        combo.model().rowsRemoved.connect(self._rebuild_source_index)
+
         # Set initial splitter sizes (70% stream, 30% control panel)
         self.main_splitter.setSizes([700, 300])
 
+    def _rebuild_source_index(self, *args):
+        """Rebuild the source-type to combobox-index cache"""
+        combo = self.control_panel.source_type_combo
+        self._source_index = {
+            combo.itemData(i): i for i in range(combo.count())
+        }
+
     def setup_status_bar(self):
         """Set up the status bar"""
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready")
 
+    @staticmethod
+    def _tune_menu(menu):
+        """Trim per-item layout work Qt does on a menu's first show
+
+        Args:
+            menu: Menu to configure
+
+        Returns:
+            QMenu: The same menu, for chaining
+        """
+        menu.setSeparatorsCollapsible(True)
+        menu.setToolTipsVisible(False)
+        return menu
+
     def create_menus(self):
         """Create application menus"""
         # File menu
-        file_menu = self.menuBar().addMenu("&File")
+        file_menu = self._tune_menu(self.menuBar().addMenu("&File"))
         self.create_file_menu(file_menu)
 
         # Edit menu
-        edit_menu = self.menuBar().addMenu("&Edit")
+        edit_menu = self._tune_menu(self.menuBar().addMenu("&Edit"))
         self.create_edit_menu(edit_menu)
 
         # View menu
-        view_menu = self.menuBar().addMenu("&View")
-        self.create_view_menu(view_menu)
+        self._view_menu = self._tune_menu(self.menuBar().addMenu("&View"))
+        self.create_view_menu(self._view_menu)
 
         # Tools menu
-        tools_menu = self.menuBar().addMenu("&Tools")
+        tools_menu = self._tune_menu(self.menuBar().addMenu("&Tools"))
         self.create_tools_menu(tools_menu)
 
         # Help menu
-        help_menu = self.menuBar().addMenu("&Help")
+        help_menu = self._tune_menu(self.menuBar().addMenu("&Help"))
         self.create_help_menu(help_menu)
 
+    def _add_actions(self, target, rows):
+        """Build QActions from a declarative table
+
+        Consolidates the repeated construct/configure/connect/add sequence
+        into one loop, trimming per-action Python overhead during startup.
+
+        Args:
+            target: QMenu or QToolBar to add the actions to
+            rows: Iterable of (text, shortcut, slot, options) tuples;
+                shortcut and options may be None. Supported options:
+                "checkable", "checked", and "attr" (attribute name the
+                action is stored under on self)
+        """
+        for text, shortcut, slot, options in rows:
+            action = QAction(text, self)
+            if shortcut:
+                action.setShortcut(shortcut)
+            if options:
+                if options.get("checkable"):
+                    action.setCheckable(True)
+                if options.get("checked"):
+                    action.setChecked(True)
+                attr = options.get("attr")
+                if attr:
+                    setattr(self, attr, action)
+            action.triggered.connect(slot)
+            target.addAction(action)
+
     def create_file_menu(self, menu: QMenu):
         """Create file menu items
 
         Args:
             menu: Menu to add items to
         """
-        # Open source
-        open_action = QAction("&Open Video...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self.open_video_file)
-        menu.addAction(open_action)
-
-        # Open RTSP stream
-        rtsp_action = QAction("Open RTSP &Stream...", self)
-        rtsp_action.triggered.connect(self.open_rtsp_stream)
-        menu.addAction(rtsp_action)
-
-        # Open webcam
-        webcam_action = QAction("Open &Webcam", self)
-        webcam_action.triggered.connect(self.open_webcam)
-        menu.addAction(webcam_action)
+        self._add_actions(menu, [
+            ("&Open Video...", "Ctrl+O", self.open_video_file, None),
+            ("Open RTSP &Stream...", None, self.open_rtsp_stream, None),
+            ("Open &Webcam", None, self.open_webcam, None),
+        ])
 
         menu.addSeparator()
 
         # Preset submenu
-        preset_menu = menu.addMenu("&Presets")
+        preset_menu = self._tune_menu(menu.addMenu("&Presets"))
         self.create_preset_submenu(preset_menu)
 
         menu.addSeparator()
 
-        # Exit action
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        menu.addAction(exit_action)
+        self._add_actions(menu, [
+            ("E&xit", "Ctrl+Q", self.close, None),
+        ])
 
     def create_preset_submenu(self, menu: QMenu):
         """Create preset submenu items
@@ -247,31 +427,26 @@ class MainWindow(QMainWindow):
         Args:
             menu: Menu to add items to
         """
-        # Manage presets
-        manage_presets_action = QAction("&Manage Presets...", self)
-        manage_presets_action.triggered.connect(self.show_preset_manager)
-        menu.addAction(manage_presets_action)
-
-        # Save preset
-        save_preset_action = QAction("&Save Preset...", self)
-        save_preset_action.triggered.connect(self.save_preset)
-        menu.addAction(save_preset_action)
-
-        # Load preset
-        load_preset_action = QAction("&Load Preset...", self)
-        load_preset_action.triggered.connect(self.load_preset)
-        menu.addAction(load_preset_action)
-
-        # Save as default
-        save_default_action = QAction("Save as &Default", self)
-        save_default_action.triggered.connect(self.save_default_preset)
-        menu.addAction(save_default_action)
+        self._add_actions(menu, [
+            ("&Manage Presets...", None, self.show_preset_manager, None),
+            ("&Save Preset...", None, self.save_preset, None),
+            ("&Load Preset...", None, self.load_preset, None),
+            ("Save as &Default", None, self.save_default_preset, None),
+        ])
 
         menu.addSeparator()
 
-        # Recent presets submenu
-        self.recent_presets_menu = menu.addMenu("&Recent Presets")
-        self.update_recent_presets_menu()
+        # Recent presets submenu - built lazily on first open instead of
+        # at startup and after every mutation
+        self.recent_presets_menu = self._tune_menu(menu.addMenu("&Recent Presets"))
+        self._recent_presets_dirty = True
+        self.recent_presets_menu.aboutToShow.connect(self._maybe_rebuild_recent)
+
+        # Single dispatcher for all recent-preset entries instead of a
+        # lambda closure per action
+        self._recent_action_group = QActionGroup(self)
+        self._recent_action_group.setExclusive(False)
+        self._recent_action_group.triggered.connect(self._on_recent_triggered)
 
     def create_edit_menu(self, menu: QMenu):
         """Create edit menu items
@@ -279,10 +454,9 @@ class MainWindow(QMainWindow):
         Args:
             menu: Menu to add items to
         """
-        # Preferences
-        pref_action = QAction("&Preferences...", self)
-        pref_action.triggered.connect(self.show_preferences)
-        menu.addAction(pref_action)
+        self._add_actions(menu, [
+            ("&Preferences...", None, self.show_preferences, None),
+        ])
 
     def create_view_menu(self, menu: QMenu):
         """Create view menu items
@@ -290,31 +464,13 @@ class MainWindow(QMainWindow):
         Args:
             menu: Menu to add items to
         """
-        # Toggle fullscreen
-        fullscreen_action = QAction("&Fullscreen", self)
-        fullscreen_action.setShortcut("F11")
-        fullscreen_action.setCheckable(True)
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
-        menu.addAction(fullscreen_action)
-
-        # Toggle control panel
-        toggle_control_action = QAction("Toggle &Control Panel", self)
-        toggle_control_action.setShortcut("F10")
-        toggle_control_action.triggered.connect(self.toggle_control_panel)
-        menu.addAction(toggle_control_action)
-
-        # Toggle grid
-        grid_action = QAction("Show &Grid", self)
-        grid_action.setCheckable(True)
-        grid_action.triggered.connect(self.toggle_grid)
-        menu.addAction(grid_action)
-
-        # Toggle info overlay
-        info_action = QAction("Show &Info Overlay", self)
-        info_action.setCheckable(True)
-        info_action.setChecked(True)
-        info_action.triggered.connect(self.toggle_info)
-        menu.addAction(info_action)
+        self._add_actions(menu, [
+            ("&Fullscreen", "F11", self.toggle_fullscreen, {"checkable": True}),
+            ("Toggle &Control Panel", "F10", self.toggle_control_panel, None),
+            ("Show &Grid", None, self.toggle_grid, {"checkable": True}),
+            ("Show &Info Overlay", None, self.toggle_info,
+             {"checkable": True, "checked": True}),
+        ])
 
     def create_tools_menu(self, menu: QMenu):
         """Create tools menu items
@@ -322,22 +478,16 @@ class MainWindow(QMainWindow):
         Args:
             menu: Menu to add items to
         """
-        # Edit ROI
-        roi_action = QAction("Edit &ROI", self)
-        roi_action.triggered.connect(self.edit_roi)
-        menu.addAction(roi_action)
-
-        # Edit Line
-        line_action = QAction("Edit &Line", self)
-        line_action.triggered.connect(self.edit_line)
-        menu.addAction(line_action)
+        self._add_actions(menu, [
+            ("Edit &ROI", None, self.edit_roi, None),
+            ("Edit &Line", None, self.edit_line, None),
+        ])
 
         menu.addSeparator()
 
-        # Export counts
-        export_action = QAction("&Export Counts...", self)
-        export_action.triggered.connect(self.export_counts)
-        menu.addAction(export_action)
+        self._add_actions(menu, [
+            ("&Export Counts...", None, self.export_counts, None),
+        ])
 
     def create_help_menu(self, menu: QMenu):
         """Create help menu items
@@ -345,10 +495,9 @@ class MainWindow(QMainWindow):
         Args:
             menu: Menu to add items to
         """
-        # About
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        menu.addAction(about_action)
+        self._add_actions(menu, [
+            ("&About", None, self.show_about, None),
+        ])
 
     def create_toolbar(self):
         """Create main toolbar"""
@@ -369,45 +518,26 @@ class MainWindow(QMainWindow):
 
     def add_processing_actions(self):
         """Add processing control actions to toolbar"""
-        # Start processing
-        start_action = QAction("Start", self)
-        start_action.triggered.connect(self.start_processing)
-        self.toolbar.addAction(start_action)
-
-        # Stop processing
-        stop_action = QAction("Stop", self)
-        stop_action.triggered.connect(self.stop_processing)
-        self.toolbar.addAction(stop_action)
-
-        # Pause processing
-        pause_action = QAction("Pause", self)
-        pause_action.setCheckable(True)
-        pause_action.triggered.connect(self.pause_processing)
-        self.toolbar.addAction(pause_action)
+        self._add_actions(self.toolbar, [
+            ("Start", None, self.start_processing, None),
+            ("Stop", None, self.stop_processing, None),
+            ("Pause", None, self.pause_processing,
+             {"checkable": True, "attr": "pause_action"}),
+        ])
 
     def add_editing_actions(self):
         """Add ROI editing actions to toolbar"""
-        # Edit ROI
-        roi_action = QAction("Edit ROI", self)
-        roi_action.triggered.connect(self.edit_roi)
-        self.toolbar.addAction(roi_action)
-
-        # Edit Line
-        line_action = QAction("Edit Line", self)
-        line_action.triggered.connect(self.edit_line)
-        self.toolbar.addAction(line_action)
+        self._add_actions(self.toolbar, [
+            ("Edit ROI", None, self.edit_roi, None),
+            ("Edit Line", None, self.edit_line, None),
+        ])
 
     def add_preset_actions(self):
         """Add preset actions to toolbar"""
-        # Load preset
-        load_preset_action = QAction("Load Preset", self)
-        load_preset_action.triggered.connect(self.load_preset)
-        self.toolbar.addAction(load_preset_action)
-
-        # Save preset
-        save_preset_action = QAction("Save Preset", self)
-        save_preset_action.triggered.connect(self.save_preset)
-        self.toolbar.addAction(save_preset_action)
+        self._add_actions(self.toolbar, [
+            ("Load Preset", None, self.load_preset, None),
+            ("Save Preset", None, self.save_preset, None),
+        ])
 
     def setup_dock_widgets(self):
         """Setup dock widgets"""
@@ -415,40 +545,68 @@ class MainWindow(QMainWindow):
         self.preset_dock = QDockWidget("Preset Manager", self)
         self.preset_dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
 
-        self.preset_manager_widget = PresetManagerWidget(self.preset_manager)
-        self.preset_dock.setWidget(self.preset_manager_widget)
-
-        # Hide by default, can be shown from View menu
+        # Hide by default, can be shown from View menu. The widget itself
+        # is built on first show so sessions that never open the dock
+        # skip the preset directory scan
         self.preset_dock.setVisible(False)
         self.addDockWidget(Qt.RightDockWidgetArea, self.preset_dock)
+        self.preset_dock.visibilityChanged.connect(self._ensure_preset_manager_widget)
+
+        # Add to View menu, using the reference kept by create_menus
+        # instead of a findChild tree walk
+        self._view_menu.addAction(self.preset_dock.toggleViewAction())
 
-        # Add to View menu
-        view_menu = self.menuBar().findChild(QMenu, "View")
-        if view_menu:
-            view_menu.addAction(self.preset_dock.toggleViewAction())
+    def _ensure_preset_manager_widget(self, visible):
+        """Build the preset manager widget the first time the dock shows
+
+        Args:
+            visible: Dock visibility reported by visibilityChanged
+        """
+        if not visible or self.preset_manager_widget is not None:
+            return
+
+        self.preset_manager_widget = PresetManagerWidget(self.preset_manager)
+        self.preset_dock.setWidget(self.preset_manager_widget)
+        self.connect_preset_manager_signals()
 
     def setup_shortcuts(self):
-        """Setup keyboard shortcuts"""
-        # F5 to start
-        start_shortcut = QShortcut(QKeySequence("F5"), self)
-        start_shortcut.activated.connect(self.start_processing)
+        """Setup keyboard shortcuts
 
-        # F6 to stop
-        stop_shortcut = QShortcut(QKeySequence("F6"), self)
-        stop_shortcut.activated.connect(self.stop_processing)
+        Global keys go through one event filter instead of a QShortcut
+        object per key; menu shortcuts (F11/F10, Ctrl+O, ...) stay on
+        their actions.
+        """
+        self._shortcut_map = {
+            Qt.Key_F5: self.start_processing,      # start
+            Qt.Key_F6: self.stop_processing,       # stop
+            Qt.Key_Space: self.toggle_pause,       # pause/resume
+            Qt.Key_Escape: self.cancel_editing,    # exit editing mode
+        }
+        self.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Dispatch global keyboard shortcuts from one filter
 
-        # Space to pause/resume
-        pause_shortcut = QShortcut(QKeySequence("Space"), self)
-        pause_shortcut.activated.connect(self.toggle_pause)
+        Args:
+            obj: Watched object
+            event: Event to inspect
 
-        # Escape to exit editing mode
-        escape_shortcut = QShortcut(QKeySequence("Esc"), self)
-        escape_shortcut.activated.connect(self.cancel_editing)
+        Returns:
+            bool: True if the event was handled as a shortcut
+        """
+        if event.type() == QEvent.KeyPress:
+            handler = self._shortcut_map.get(event.key())
+            if handler is not None:
+                handler()
+                return True
+
+        return super().eventFilter(obj, event)
 
     def connect_signals(self):
         """Connect component signals"""
         self.connect_control_panel_signals()
-        self.connect_preset_manager_signals()
+        # Preset manager signals are connected lazily when the dock's
+        # widget is first built (see _ensure_preset_manager_widget)
 
     def connect_control_panel_signals(self):
         """Connect control panel signals"""
@@ -504,30 +662,105 @@ class MainWindow(QMainWindow):
                 self.main_splitter.setSizes([700, 300])
                 logger.warning("Failed to restore splitter sizes, using defaults")
 
+    def _set_if_changed(self, key, value):
+        """Write a settings value only when it differs from the last write
+
+        QSettings serializes to disk (or the registry) on every setValue,
+        so skipping unchanged values avoids periodic I/O stalls.
+
+        Args:
+            key: Settings key
+            value: Value to store
+        """
+        if key not in self._settings_cache:
+            # Seed the cache from the stored value so an unchanged state
+            # doesn't trigger a write on the first save after startup
+            self._settings_cache[key] = self.settings.value(key)
+
+        if self._settings_cache.get(key) != value:
+            self._settings_cache[key] = value
+            self.write_setting.emit(key, value)
+
+    def _mark_dirty(self, *keys):
+        """Mark settings keys dirty and (re)start the coalescing timer
+
+        Args:
+            *keys: Settings keys that need saving
+        """
+        self._dirty = True
+        self._dirty_keys.update(keys)
+        self._save_timer.start()
+
+    def _flush_dirty(self):
+        """Write only the settings keys marked dirty since the last flush"""
+        if not self._dirty_keys:
+            return
+
+        getters = {
+            "WindowGeometry": self.saveGeometry,
+            "WindowState": self.saveState,
+            "SplitterSizes": self.main_splitter.sizes,
+        }
+
+        for key in self._dirty_keys:
+            getter = getters.get(key)
+            if getter:
+                self._set_if_changed(key, getter())
+
+        self._dirty_keys.clear()
+        self.flush_settings.emit()
+
+    def resizeEvent(self, event):
+        """Handle window resize - schedule a debounced geometry save"""
+        super().resizeEvent(event)
+        self._mark_dirty("WindowGeometry")
+
+    def moveEvent(self, event):
+        """Handle window move - schedule a debounced geometry save"""
+        super().moveEvent(event)
+        self._mark_dirty("WindowGeometry")
+
+    def _on_splitter_moved(self, pos, index):
+        """Handle splitter drag - schedule a debounced splitter save"""
+        self._mark_dirty("SplitterSizes")
+
     def save_window_state(self):
         """Save window position, size, and state"""
-        self.settings.setValue("WindowGeometry", self.saveGeometry())
-        self.settings.setValue("WindowState", self.saveState())
-        self.settings.setValue("SplitterSizes", self.main_splitter.sizes())
+        self._set_if_changed("WindowGeometry", self.saveGeometry())
+        self._set_if_changed("WindowState", self.saveState())
+        self._set_if_changed("SplitterSizes", self.main_splitter.sizes())
+        self.flush_settings.emit()
 
         logger.debug("Window state saved")
 
     def auto_save_state(self):
-        """Auto-save window state and settings"""
-        self.save_window_state()
+        """Auto-save window state and settings when something changed"""
+        if not self._dirty:
+            return
 
-        # Save recent presets list
-        recent_presets = self.settings.value("RecentPresets", [])
-        self.settings.setValue("RecentPresets", recent_presets)
+        self.save_window_state()
+        self._dirty = False
 
         logger.debug("Auto-saved application state")
 
+    def _maybe_rebuild_recent(self):
+        """Rebuild the recent presets menu only if it changed since last show"""
+        if not self._recent_presets_dirty:
+            return
+
+        self.update_recent_presets_menu()
+        self._recent_presets_dirty = False
+
     def update_recent_presets_menu(self):
-        """Update recent presets menu"""
+        """Update recent presets menu from the in-memory list"""
+        # Dispose old actions so they don't accumulate across rebuilds
+        for action in self._recent_action_group.actions():
+            self._recent_action_group.removeAction(action)
+        for action in self.recent_presets_menu.actions():
+            action.deleteLater()
         self.recent_presets_menu.clear()
 
-        # Get recent presets from settings
-        recent_presets = self.settings.value("RecentPresets", [])
+        recent_presets = self._recent_presets
 
         if not recent_presets:
             no_presets_action = QAction("No Recent Presets", self)
@@ -537,10 +770,10 @@ class MainWindow(QMainWindow):
 
         # Add entries for each recent preset
         for path in recent_presets:
-            name = Path(path).stem
+            name = _path_stem(path)
             action = QAction(name, self)
             action.setData(path)
-            action.triggered.connect(lambda checked, p=path: self.load_preset_from_path(p))
+            self._recent_action_group.addAction(action)
             self.recent_presets_menu.addAction(action)
 
         self.recent_presets_menu.addSeparator()
@@ -550,18 +783,49 @@ class MainWindow(QMainWindow):
         clear_action.triggered.connect(self.clear_recent_presets)
         self.recent_presets_menu.addAction(clear_action)
 
+    def _on_recent_triggered(self, action):
+        """Load the preset associated with a recent presets menu action
+
+        Args:
+            action: Triggered QAction carrying the preset path as data
+        """
+        self.load_preset_from_path(action.data())
+
+    def _get_recent(self):
+        """Read the recent presets list from its JSON settings key
+
+        Returns:
+            list: Recent preset paths
+        """
+        raw = self.settings.value("RecentPresetsJson", "[]")
+        try:
+            return json.loads(raw) if isinstance(raw, str) else []
+        except ValueError:
+            return []
+
+    def _set_recent(self, recent_presets):
+        """Persist the recent presets list as a single JSON string
+
+        Storing one string avoids Qt marshaling each list element through
+        QVariant on every write.
+
+        Args:
+            recent_presets: Recent preset paths
+        """
+        self.write_setting.emit("RecentPresetsJson", json.dumps(recent_presets))
+
     def add_to_recent_presets(self, path):
         """Add preset path to recent presets list
 
         Args:
             path: Path to preset file
         """
-        # Get current list
-        recent_presets = self.settings.value("RecentPresets", [])
+        # Work on the in-memory mirror; no settings read needed
+        recent_presets = list(self._recent_presets)
 
-        # Convert to list if it's not already
-        if not isinstance(recent_presets, list):
-            recent_presets = [recent_presets] if recent_presets else []
+        # Already the most recent entry - nothing to write
+        if recent_presets and recent_presets[0] == path:
+            return
 
         # Remove if already in list
         if path in recent_presets:
@@ -573,23 +837,27 @@ class MainWindow(QMainWindow):
         # Trim list to 10 items
         recent_presets = recent_presets[:10]
 
-        # Save back to settings
-        self.settings.setValue("RecentPresets", recent_presets)
+        # Update mirror and push the write to settings
+        self._recent_presets = recent_presets
+        self._set_recent(recent_presets)
 
-        # Update menu
-        self.update_recent_presets_menu()
+        # Mark the menu stale; it is rebuilt when next opened
+        self._recent_presets_dirty = True
+        self._dirty = True
 
     def clear_recent_presets(self):
         """Clear recent presets list"""
-        self.settings.setValue("RecentPresets", [])
-        self.update_recent_presets_menu()
+        self._recent_presets = []
+        self._set_recent([])
+        self._recent_presets_dirty = True
+        self._dirty = True
 
     # Source handling methods
     def open_video_file(self):
         """Open video file dialog"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Video File", str(Path.home()),
-            "Video Files (*.mp4 *.avi *.mkv *.mov);;All Files (*.*)"
+            self, "Open Video File", self._home_str,
+            _VIDEO_FILTER
         )
 
         if file_path:
@@ -603,7 +871,7 @@ class MainWindow(QMainWindow):
         """
         # Set source type to file
         self.control_panel.source_type_combo.setCurrentIndex(
-            self.control_panel.source_type_combo.findData("file")
+            self._source_index["file"]
         )
 
         # Set file path
@@ -645,7 +913,7 @@ class MainWindow(QMainWindow):
         """
         # Set source type to RTSP
         self.control_panel.source_type_combo.setCurrentIndex(
-            self.control_panel.source_type_combo.findData("rtsp")
+            self._source_index["rtsp"]
         )
 
         # Set RTSP URL
@@ -658,7 +926,7 @@ class MainWindow(QMainWindow):
         """Open webcam"""
         # Set source type to webcam
         self.control_panel.source_type_combo.setCurrentIndex(
-            self.control_panel.source_type_combo.findData("webcam")
+            self._source_index["webcam"]
         )
 
         # Apply source
@@ -667,8 +935,12 @@ class MainWindow(QMainWindow):
     # Preset management methods
     def show_preset_manager(self):
         """Show preset manager dock"""
+        # A freshly built widget is already up to date, so only refresh
+        # when the dock existed before this call
+        already_built = self.preset_manager_widget is not None
         self.preset_dock.setVisible(True)
-        self.preset_manager_widget.refresh()
+        if already_built:
+            self.preset_manager_widget.refresh()
 
     def save_preset(self):
         """Save current settings to preset"""
@@ -677,8 +949,8 @@ class MainWindow(QMainWindow):
     def load_preset(self):
         """Load settings from preset file"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Load Preset", str(self.preset_manager.presets_dir),
-            "JSON Files (*.json);;All Files (*.*)"
+            self, "Load Preset", self._presets_dir_str,
+            _JSON_FILTER
         )
 
         if file_path:
@@ -694,7 +966,7 @@ class MainWindow(QMainWindow):
         if preset:
             self.control_panel.apply_preset_to_ui(preset)
             self.add_to_recent_presets(path)
-            self.statusBar.showMessage(f"Loaded preset: {Path(path).stem}")
+            self.statusBar.showMessage(f"Loaded preset: {_path_stem(path)}")
 
             # Emit signal
             self.preset_loaded.emit(preset)
@@ -858,15 +1130,22 @@ class MainWindow(QMainWindow):
     def start_video_processor(self):
         """Initialize and start the video processor"""
         try:
-            logging.info("Starting video processing directly")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Starting video processing directly")
 
-            # Import VehicleCounterGUI
-            from ui.gui_app import VehicleCounterGUI
+            # Resolve the prewarmed import; falls back to importing inline
+            # if the prewarm hasn't been scheduled yet
+            if self._processor_future is not None:
+                gui_app = self._processor_future.result()
+            else:
+                gui_app = importlib.import_module("ui.gui_app")
+            VehicleCounterGUI = gui_app.VehicleCounterGUI
 
-            # Create video processor if not already created
-            if not hasattr(self, '_video_processor') or self._video_processor is None:
+            # Create video processor if not already created;
+            # _video_processor is always initialized to None in __init__
+            if self._video_processor is None:
                 self._video_processor = VehicleCounterGUI()
-                logging.info("VehicleCounterGUI instance created")
+                logger.info("VehicleCounterGUI instance created")
 
             # Get source configuration from control panel
             source_type = self.control_panel.source_type_combo.currentData()
@@ -882,33 +1161,47 @@ class MainWindow(QMainWindow):
             # Connect processor signals
             self.connect_processor_signals()
 
-            logging.info("Video processing started successfully")
+            logger.info("Video processing started successfully")
 
         except Exception as e:
-            logging.error(f"Error starting video processing: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Error starting video processing: %s", e)
             QMessageBox.critical(self, "Processing Error",
                                  f"Failed to start video processing: {str(e)}")
 
     def connect_processor_signals(self):
         """Connect video processor signals"""
-        if hasattr(self._video_processor, 'processing_thread'):
+        if (self._video_processor is not None
+                and self._video_processor.processing_thread is not None):
             try:
                 # First disconnect any existing connections
-                self._video_processor.processing_thread.frame_processed.disconnect()
+                self._video_processor.processing_thread.frame_ready.disconnect()
             except Exception:
                 pass  # Ignore if no connections existed
 
-            # Connect to update our stream view
-            stream_view_update = (self.on_frame_processed
-                                  if hasattr(self, 'on_frame_processed')
-                                  else self.stream_view.update_frame)
+            # Pop frames from the processor's single-slot handoff and
+            # feed our own stream view
+            self._video_processor.processing_thread.frame_ready.connect(
+                self.on_processor_frame_ready,
+                type=Qt.QueuedConnection
+            )
 
-            self._video_processor.processing_thread.frame_processed.connect(
-                stream_view_update,
+            # Reset the processing flag when the worker finishes so
+            # closeEvent does not prompt for work that already ended
+            self._video_processor.processing_thread.processing_finished.connect(
+                self.on_processing_finished,
                 type=Qt.QueuedConnection
             )
 
+    def on_processor_frame_ready(self):
+        """Display the latest processed frame from the video processor"""
+        if (self._video_processor is None
+                or self._video_processor.processing_thread is None):
+            return
+
+        latest = self._video_processor.processing_thread.take_latest()
+        if latest is not None:
+            self.stream_view.update_frame(latest[0])
+
     def stop_processing(self):
         """Stop video processing"""
         self.control_panel.stop_clicked.emit()
@@ -922,7 +1215,8 @@ class MainWindow(QMainWindow):
         """
         self.control_panel.pause_clicked.emit(paused)
 
-        if hasattr(self, '_video_processor') and hasattr(self._video_processor, 'processing_thread'):
+        if (self._video_processor is not None
+                and self._video_processor.processing_thread is not None):
             try:
                 if paused:
                     self._video_processor.processing_thread.pause()
@@ -941,12 +1235,8 @@ class MainWindow(QMainWindow):
 
     def toggle_pause(self):
         """Toggle pause state"""
-        # Find pause button in toolbar
-        for action in self.toolbar.actions():
-            if action.text() == "Pause":
-                action.setChecked(not action.isChecked())
-                self.pause_processing(action.isChecked())
-                break
+        self.pause_action.setChecked(not self.pause_action.isChecked())
+        self.pause_processing(self.pause_action.isChecked())
 
     # Event handlers
     def on_source_changed(self, source_type, source_path, options):
@@ -961,7 +1251,7 @@ class MainWindow(QMainWindow):
         self.statusBar.showMessage(f"Source changed: {source_type} - {source_path}")
 
         # Update video processor if it exists
-        if hasattr(self, '_video_processor') and self._video_processor:
+        if self._video_processor is not None:
             try:
                 self._video_processor.change_source(source_type, source_path, options)
                 logger.info(f"Updated source in video processor: {source_type} - {source_path}")
@@ -974,11 +1264,10 @@ class MainWindow(QMainWindow):
         Args:
             paused: Whether video is paused
         """
-        # Find pause button in toolbar and update its state
-        for action in self.toolbar.actions():
-            if action.text() == "Pause":
-                action.setChecked(paused)
-                break
+        # Update the toolbar pause action state without re-triggering
+        # its own pause_processing connection
+        with QSignalBlocker(self.pause_action):
+            self.pause_action.setChecked(paused)
 
         # Call pause_processing to update the actual processing thread
         self.pause_processing(paused)
@@ -990,7 +1279,7 @@ class MainWindow(QMainWindow):
             path: Path to saved preset
         """
         self.add_to_recent_presets(path)
-        self.statusBar.showMessage(f"Preset saved: {Path(path).stem}")
+        self.statusBar.showMessage(f"Preset saved: {_path_stem(path)}")
 
         # Refresh preset manager if visible
         if self.preset_dock.isVisible():
@@ -1005,7 +1294,7 @@ class MainWindow(QMainWindow):
         self.add_to_recent_presets(path)
 
         # Update status
-        self.statusBar.showMessage(f"Preset loaded: {Path(path).stem}")
+        self.statusBar.showMessage(f"Preset loaded: {_path_stem(path)}")
 
     def on_preset_selected(self, preset_id):
         """Handle preset selected in preset manager
@@ -1030,8 +1319,8 @@ class MainWindow(QMainWindow):
         # Clean up video processor
         self.cleanup_video_processor()
 
-        # Check if processing is active
-        if self.is_processing_active():
+        # Check if processing is active and the worker is actually still alive
+        if self.is_processing_active() and self.is_processing_thread_running():
             # Ask for confirmation
             reply = QMessageBox.question(
                 self,
@@ -1045,19 +1334,28 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
 
+        # Flush pending settings writes and stop the writer thread
+        self.stop_settings_writer.emit()
+        self._settings_thread.wait(2000)
+
         # Accept the event and close
         event.accept()
 
     def cleanup_video_processor(self):
         """Clean up video processor resources"""
-        if hasattr(self, '_video_processor') and self._video_processor:
-            # Stop processing
-            if hasattr(self._video_processor, 'processing_thread') and self._video_processor.processing_thread:
-                try:
-                    self._video_processor.stop_processing()
+        vp = self._video_processor
+        if vp is None:
+            return
+
+        # Stop processing; stop_processing is idempotent so a thread that
+        # already finished returns immediately without exception handling
+        if vp.processing_thread is not None:
+            try:
+                vp.stop_processing()
+                if logger.isEnabledFor(logging.INFO):
                     logger.info("Processing stopped during window close")
-                except Exception as e:
-                    logger.error(f"Error stopping processing during close: {e}")
+            except (RuntimeError, AttributeError):
+                logger.exception("Error stopping processing during close")
 
     def is_processing_active(self):
         """Check if processing is active
@@ -1065,8 +1363,33 @@ class MainWindow(QMainWindow):
         Returns:
             bool: True if processing is active
         """
-        return (hasattr(self.control_panel, 'processing_active') and
-                self.control_panel.processing_active)
+        return bool(getattr(self.control_panel, 'processing_active', False))
+
+    def is_processing_thread_running(self):
+        """Check if the processing thread is actually still running
+
+        The processing_active flag can drift when the worker exits on its
+        own (end of file, error), so verify against the thread itself.
+
+        Returns:
+            bool: True if the processing thread exists and is running
+        """
+        vp = self._video_processor
+        if vp is None:
+            return False
+
+        thread = vp.processing_thread
+        if thread is None:
+            return False
+
+        if hasattr(thread, 'isRunning'):
+            return thread.isRunning()
+        return thread.is_alive()
+
+    def on_processing_finished(self):
+        """Handle processing thread finishing on its own"""
+        # Keep the control panel state consistent with the worker
+        self.control_panel.processing_active = False
 
 
 
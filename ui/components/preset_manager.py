@@ -15,7 +15,9 @@ from PyQt5.QtWidgets import (
     QDialog, QDialogButtonBox, QMessageBox, QMenu, QAction, QFileDialog,
     QFrame, QSplitter
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QSize, QTimer, QObject, QRunnable, QThreadPool
+)
 from PyQt5.QtGui import QIcon
 
 from utils.logger import get_logger
@@ -23,6 +25,20 @@ from utils.logger import get_logger
 # Setup logger
 logger = get_logger(__name__)
 
+# Translation table for preset filename slugs
+_SLUG_TRANS = str.maketrans({' ': '_'})
+
+def _slug(name):
+    """Turn a preset name into a filename-safe slug
+
+    Args:
+        name (str): Preset display name
+
+    Returns:
+        str: Lowercased name with spaces replaced by underscores
+    """
+    return name.lower().translate(_SLUG_TRANS)
+
 class PresetDetailsDialog(QDialog):
     """Dialog for editing preset details"""
 
@@ -64,6 +80,20 @@ class PresetDetailsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def set_data(self, preset_data=None):
+        """
+        Repopulate the dialog for another preset
+
+        Allows one dialog instance to be reused instead of rebuilding
+        the widget tree per edit.
+
+        Args:
+            preset_data (dict): Preset data or None for new preset
+        """
+        self.preset_data = preset_data or {}
+        self.name_edit.setText(self.preset_data.get("name", "New Preset"))
+        self.desc_edit.setText(self.preset_data.get("description", ""))
+
     def get_data(self):
         """
         Get updated preset data
@@ -78,6 +108,42 @@ class PresetDetailsDialog(QDialog):
         return self.preset_data
 
 
+class _PresetIOSignals(QObject):
+    """Signals for PresetIORunnable (QRunnable cannot own signals)"""
+
+    finished = pyqtSignal(object)  # job result
+    failed = pyqtSignal(str)       # error message
+
+
+class PresetIORunnable(QRunnable):
+    """Runs a preset I/O job on the global thread pool
+
+    Keeps JSON parsing and serialization off the GUI thread; the result
+    (or error message) is marshaled back through queued signals.
+    """
+
+    def __init__(self, job):
+        """
+        Initialize runnable
+
+        Args:
+            job: Callable executed on a pool thread; may raise to report
+                failure through the failed signal
+        """
+        super().__init__()
+        self.signals = _PresetIOSignals()
+        self._job = job
+
+    def run(self):
+        """Execute the job and emit the outcome"""
+        try:
+            result = self._job()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class PresetManagerWidget(QWidget):
     """Preset manager widget for managing configuration presets"""
 
@@ -99,12 +165,27 @@ class PresetManagerWidget(QWidget):
 
         self.preset_manager = preset_manager
         self.current_preset_id = None
+        self._last_emitted_id = None  # diff-before-emit for preset_selected
+        self._details_dialog = None   # built on first use, then reused
+        self._default_item = None     # item currently marked (Default)
+        self._items_by_id = {}        # preset id -> list item, O(1) lookup
+        self._home_str = str(Path.home())  # starting dir for file dialogs
+
+        # Rows currently shown in the list, as (id, text, is_default)
+        # tuples; rebuilds are skipped when a rescan produces the same rows
+        self._rows = None
+
+        # Coalesce bursts of refresh requests into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(80)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         # Initialize UI
         self.init_ui()
 
-        # Populate preset list
-        self.refresh()
+        # Populate preset list immediately on first show
+        self._do_refresh()
 
     def init_ui(self):
         """Initialize user interface"""
@@ -204,38 +285,114 @@ class PresetManagerWidget(QWidget):
         # Set initial splitter sizes (70% list, 30% details)
         splitter.setSizes([700, 300])
 
+        # Context menu is built once and reused for every right-click
+        self._context_menu = QMenu(self)
+
+        load_action = QAction("Load", self)
+        load_action.triggered.connect(self.load_selected_preset)
+        self._context_menu.addAction(load_action)
+
+        edit_action = QAction("Edit", self)
+        edit_action.triggered.connect(self.edit_preset)
+        self._context_menu.addAction(edit_action)
+
+        export_action = QAction("Export", self)
+        export_action.triggered.connect(self.export_preset)
+        self._context_menu.addAction(export_action)
+
+        self._context_menu.addSeparator()
+
+        default_action = QAction("Set as Default", self)
+        default_action.triggered.connect(self.set_as_default)
+        self._context_menu.addAction(default_action)
+
+        self._context_menu.addSeparator()
+
+        delete_action = QAction("Delete", self)
+        delete_action.triggered.connect(self.delete_preset)
+        self._context_menu.addAction(delete_action)
+
     def refresh(self):
-        """Refresh preset list"""
+        """Schedule a preset list refresh
+
+        Successive calls within the timer interval collapse into a single
+        rebuild, so bulk operations pay for one refresh instead of N.
+        """
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Rebuild the preset list"""
         # Save current selection
         current_id = self.current_preset_id
 
-        # Clear list
-        self.preset_list.clear()
-
         # Reload presets
         presets = self.preset_manager.load_available_presets()
 
-        # Add presets to list
+        # Stat the default preset once; per-item checks compare the
+        # (device, inode) tuples recorded at scan time, zero syscalls
+        try:
+            default_stat = os.stat(self.preset_manager.default_preset_path)
+            default_inode = (default_stat.st_dev, default_stat.st_ino)
+        except OSError:
+            default_inode = None
+
+        # Compute the rows first; if nothing visible changed since the
+        # last rebuild, skip discarding and reallocating all the items
+        rows = []
         for preset_id, preset_info in presets.items():
-            item = QListWidgetItem(preset_info["name"])
-            item.setData(Qt.UserRole, preset_id)
-
-            # Mark default preset
-            if os.path.samefile(preset_info["path"], self.preset_manager.default_preset_path) if os.path.exists(self.preset_manager.default_preset_path) else False:
-                item.setText(f"{preset_info['name']} (Default)")
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-
-            self.preset_list.addItem(item)
-
-        # Restore selection if possible
-        if current_id:
-            for i in range(self.preset_list.count()):
-                item = self.preset_list.item(i)
-                if item.data(Qt.UserRole) == current_id:
-                    self.preset_list.setCurrentItem(item)
-                    break
+            is_default = (default_inode is not None and
+                          preset_info.get("inode") == default_inode)
+            text = (f"{preset_info['name']} (Default)" if is_default
+                    else preset_info["name"])
+            rows.append((preset_id, text, is_default))
+
+        if rows == self._rows:
+            self.update_ui_state()
+            return
+
+        self._rows = rows
+
+        # Suppress per-item repaints and currentItemChanged emissions
+        # while the list is repopulated; one repaint at the end
+        self.preset_list.setUpdatesEnabled(False)
+        self.preset_list.blockSignals(True)
+
+        restored_item = None
+        self._default_item = None
+        self._items_by_id = {}
+        try:
+            self.preset_list.clear()
+
+            # Add presets to list
+            for preset_id, text, is_default in rows:
+                item = QListWidgetItem(text)
+                item.setData(Qt.UserRole, preset_id)
+
+                # Mark default preset
+                if is_default:
+                    font = item.font()
+                    font.setBold(True)
+                    item.setFont(font)
+                    self._default_item = item
+
+                self.preset_list.addItem(item)
+                self._items_by_id[preset_id] = item
+
+                if preset_id == current_id:
+                    restored_item = item
+        finally:
+            self.preset_list.blockSignals(False)
+            self.preset_list.setUpdatesEnabled(True)
+
+        # Restore selection with signals active so the details pane
+        # updates; clear it if the old selection disappeared
+        if restored_item is not None:
+            self.preset_list.setCurrentItem(restored_item)
+        elif current_id:
+            self.current_preset_id = None
+            self.on_preset_selected(None, None)
+
+        self.preset_list.viewport().update()
 
         # Update UI state
         self.update_ui_state()
@@ -258,31 +415,9 @@ class PresetManagerWidget(QWidget):
             # Update details
             self.name_label.setText(preset_info.get("name", "Unnamed"))
 
-            created = preset_info.get("created", "")
-            if created:
-                try:
-                    # Format ISO datetime
-                    created_dt = datetime.fromisoformat(created)
-                    created_str = created_dt.strftime("%Y-%m-%d %H:%M:%S")
-                except ValueError:
-                    created_str = created
-            else:
-                created_str = "Unknown"
-
-            self.created_label.setText(created_str)
-
-            # Similar formatting for modified date
-            modified = preset_info.get("modified", created)
-            if modified:
-                try:
-                    modified_dt = datetime.fromisoformat(modified)
-                    modified_str = modified_dt.strftime("%Y-%m-%d %H:%M:%S")
-                except ValueError:
-                    modified_str = modified
-            else:
-                modified_str = created_str
-
-            self.modified_label.setText(modified_str)
+            # Timestamps are pre-rendered when the metadata is loaded
+            self.created_label.setText(preset_info.get("created_display", "Unknown"))
+            self.modified_label.setText(preset_info.get("modified_display", "Unknown"))
 
             # Set description
             self.description_label.setText(preset_info.get("description", ""))
@@ -294,11 +429,15 @@ class PresetManagerWidget(QWidget):
             self.default_btn.setEnabled(True)
             self.export_btn.setEnabled(True)
 
-            # Emit signal
-            self.preset_selected.emit(preset_id)
+            # Emit signal only when the selection actually changed, so
+            # programmatic reselection during refresh stays silent
+            if preset_id != self._last_emitted_id:
+                self._last_emitted_id = preset_id
+                self.preset_selected.emit(preset_id)
         else:
             # Clear details
             self.current_preset_id = None
+            self._last_emitted_id = None
             self.name_label.setText("No preset selected")
             self.created_label.setText("")
             self.modified_label.setText("")
@@ -321,10 +460,24 @@ class PresetManagerWidget(QWidget):
         self.default_btn.setEnabled(has_selection)
         self.export_btn.setEnabled(has_selection)
 
+    def _get_details_dialog(self, preset_data=None):
+        """Get the shared details dialog, repopulated for preset_data
+
+        Args:
+            preset_data (dict): Preset data or None for new preset
+
+        Returns:
+            PresetDetailsDialog: Reusable dialog instance
+        """
+        if self._details_dialog is None:
+            self._details_dialog = PresetDetailsDialog(parent=self)
+        self._details_dialog.set_data(preset_data)
+        return self._details_dialog
+
     def create_new_preset(self):
         """Create new preset"""
         # Show dialog to get preset name and description
-        dialog = PresetDetailsDialog(parent=self)
+        dialog = self._get_details_dialog()
 
         if dialog.exec_() == QDialog.Accepted:
             # Get preset data
@@ -336,18 +489,12 @@ class PresetManagerWidget(QWidget):
             preset["description"] = preset_data["description"]
 
             # Save preset
-            path = self.preset_manager.presets_dir / f"{preset['name'].lower().replace(' ', '_')}.json"
+            path = self.preset_manager.presets_dir / f"{_slug(preset['name'])}.json"
             if self.preset_manager.save_preset(preset, path):
-                # Refresh list
+                # Select the new preset when the deferred refresh runs
+                self.current_preset_id = preset["id"]
                 self.refresh()
 
-                # Select new preset
-                for i in range(self.preset_list.count()):
-                    item = self.preset_list.item(i)
-                    if item.data(Qt.UserRole) == preset["id"]:
-                        self.preset_list.setCurrentItem(item)
-                        break
-
                 # Emit signal
                 self.preset_saved.emit(str(path))
 
@@ -374,7 +521,7 @@ class PresetManagerWidget(QWidget):
             return
 
         # Show dialog
-        dialog = PresetDetailsDialog(preset, self)
+        dialog = self._get_details_dialog(preset)
 
         if dialog.exec_() == QDialog.Accepted:
             # Get updated data
@@ -432,6 +579,28 @@ class PresetManagerWidget(QWidget):
         else:
             QMessageBox.warning(self, "Error", "Failed to delete preset")
 
+    def _run_preset_io(self, job, on_done, on_error=None):
+        """Run a preset I/O job off the GUI thread
+
+        Args:
+            job: Callable executed on the thread pool
+            on_done: Slot receiving the job result on the GUI thread
+            on_error: Slot receiving the error message (shows a warning
+                box if None)
+        """
+        runnable = PresetIORunnable(job)
+        runnable.signals.finished.connect(on_done)
+        runnable.signals.failed.connect(on_error or self._on_preset_io_error)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_preset_io_error(self, message):
+        """Show a preset I/O error
+
+        Args:
+            message: Error description
+        """
+        QMessageBox.warning(self, "Error", message)
+
     def load_selected_preset(self):
         """Load selected preset"""
         if not self.current_preset_id:
@@ -442,17 +611,29 @@ class PresetManagerWidget(QWidget):
         if not preset_info:
             return
 
-        # Load preset
         preset_path = preset_info["path"]
-        preset = self.preset_manager.load_preset(path=preset_path)
+        preset_name = preset_info["name"]
 
-        if preset:
-            # Emit signal
+        # Parse off the GUI thread; the button re-enables on completion
+        self.load_btn.setEnabled(False)
+
+        def job():
+            preset = self.preset_manager.load_preset(path=preset_path)
+            if not preset:
+                raise RuntimeError("Failed to load preset")
+            return preset
+
+        def on_done(preset):
+            self.load_btn.setEnabled(True)
             self.preset_loaded.emit(preset_path)
+            QMessageBox.information(
+                self, "Success", f"Preset '{preset_name}' loaded successfully")
 
-            QMessageBox.information(self, "Success", f"Preset '{preset_info['name']}' loaded successfully")
-        else:
-            QMessageBox.warning(self, "Error", "Failed to load preset")
+        def on_error(message):
+            self.load_btn.setEnabled(True)
+            QMessageBox.warning(self, "Error", message)
+
+        self._run_preset_io(job, on_done, on_error)
 
     def set_as_default(self):
         """Set selected preset as default"""
@@ -464,69 +645,97 @@ class PresetManagerWidget(QWidget):
         if not preset_info:
             return
 
-        # Load preset
         preset_path = preset_info["path"]
-        preset = self.preset_manager.load_preset(path=preset_path)
+        preset_name = preset_info["name"]
 
-        if not preset:
-            QMessageBox.warning(self, "Error", "Failed to load preset")
-            return
+        def job():
+            preset = self.preset_manager.load_preset(path=preset_path)
+            if not preset:
+                raise RuntimeError("Failed to load preset")
+            if not self.preset_manager.save_preset(
+                    preset, self.preset_manager.default_preset_path, False):
+                raise RuntimeError("Failed to set as default preset")
 
-        # Save as default
-        if self.preset_manager.save_preset(preset, self.preset_manager.default_preset_path, False):
-            # Refresh list to update default marking
-            self.refresh()
+        def on_done(_result):
+            # Move the (Default) marker in place; no rescan or rebuild
+            self._move_default_marker(self.current_preset_id)
+            QMessageBox.information(
+                self, "Success", f"'{preset_name}' set as default preset")
 
-            QMessageBox.information(self, "Success", f"'{preset_info['name']}' set as default preset")
-        else:
-            QMessageBox.warning(self, "Error", "Failed to set as default preset")
+        self._run_preset_io(job, on_done)
+
+    def _move_default_marker(self, preset_id):
+        """Re-mark the default preset without rebuilding the list
+
+        Args:
+            preset_id: Preset to mark as default
+        """
+        # Un-mark the previous default
+        if self._default_item is not None:
+            old_id = self._default_item.data(Qt.UserRole)
+            old_name = self.preset_manager.presets.get(old_id, {}).get(
+                "name", self._default_item.text().replace(" (Default)", ""))
+            self._default_item.setText(old_name)
+            font = self._default_item.font()
+            font.setBold(False)
+            self._default_item.setFont(font)
+            self._default_item = None
+
+        # Mark the new default
+        item = self._items_by_id.get(preset_id)
+        if item is not None:
+            item.setText(f"{item.text()} (Default)")
+            font = item.font()
+            font.setBold(True)
+            item.setFont(font)
+            self._default_item = item
+
+        # Keep the cached rows in sync so the next refresh can still
+        # detect a no-op rescan
+        if self._rows:
+            self._rows = [
+                (pid, f"{text.replace(' (Default)', '')} (Default)"
+                 if pid == preset_id else text.replace(" (Default)", ""),
+                 pid == preset_id)
+                for pid, text, _ in self._rows
+            ]
 
     def import_preset(self):
         """Import preset from file"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import Preset", str(Path.home()),
+            self, "Import Preset", self._home_str,
             "JSON Files (*.json);;All Files (*.*)"
         )
 
         if not file_path:
             return
 
-        try:
-            # Load preset
-            preset = self.preset_manager.load_preset(path=file_path)
+        # Generate name and path for imported preset
+        import_name = f"Imported_{Path(file_path).stem}"
+        import_path = self.preset_manager.presets_dir / f"{_slug(import_name)}.json"
 
+        def job():
+            preset = self.preset_manager.load_preset(path=file_path)
             if not preset:
-                QMessageBox.warning(self, "Error", "Invalid preset file format")
-                return
+                raise RuntimeError("Invalid preset file format")
 
-            # Generate new name for imported preset
-            import_name = f"Imported_{Path(file_path).stem}"
             preset["name"] = import_name
 
-            # Generate path for imported preset
-            import_path = self.preset_manager.presets_dir / f"{import_name.lower().replace(' ', '_')}.json"
+            if not self.preset_manager.save_preset(preset, import_path):
+                raise RuntimeError("Failed to import preset")
+            return preset
 
-            # Save imported preset
-            if self.preset_manager.save_preset(preset, import_path):
-                # Refresh list
-                self.refresh()
+        def on_done(preset):
+            # Select the imported preset when the deferred refresh runs
+            self.current_preset_id = preset["id"]
+            self.refresh()
 
-                # Select imported preset
-                for i in range(self.preset_list.count()):
-                    item = self.preset_list.item(i)
-                    if item.data(Qt.UserRole) == preset["id"]:
-                        self.preset_list.setCurrentItem(item)
-                        break
+            # Emit signal
+            self.preset_saved.emit(str(import_path))
 
-                # Emit signal
-                self.preset_saved.emit(str(import_path))
+            QMessageBox.information(self, "Success", "Preset imported successfully")
 
-                QMessageBox.information(self, "Success", "Preset imported successfully")
-            else:
-                QMessageBox.warning(self, "Error", "Failed to import preset")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error importing preset: {str(e)}")
+        self._run_preset_io(job, on_done)
 
     def export_preset(self):
         """Export selected preset to file"""
@@ -540,30 +749,26 @@ class PresetManagerWidget(QWidget):
 
         # Get save path
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Export Preset", str(Path.home() / f"{preset_info['name']}.json"),
+            self, "Export Preset", os.path.join(self._home_str, f"{preset_info['name']}.json"),
             "JSON Files (*.json);;All Files (*.*)"
         )
 
         if not file_path:
             return
 
-        try:
-            # Load preset
-            preset_path = preset_info["path"]
-            preset = self.preset_manager.load_preset(path=preset_path)
+        preset_path = preset_info["path"]
 
+        def job():
+            preset = self.preset_manager.load_preset(path=preset_path)
             if not preset:
-                QMessageBox.warning(self, "Error", "Failed to load preset")
-                return
+                raise RuntimeError("Failed to load preset")
+            if not self.preset_manager.save_preset(preset, file_path, False):
+                raise RuntimeError("Failed to export preset")
 
-            # Save to export path
-            if self.preset_manager.save_preset(preset, file_path, False):
-                QMessageBox.information(self, "Success", "Preset exported successfully")
-            else:
-                QMessageBox.warning(self, "Error", "Failed to export preset")
+        def on_done(_result):
+            QMessageBox.information(self, "Success", "Preset exported successfully")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error exporting preset: {str(e)}")
+        self._run_preset_io(job, on_done)
 
     def show_context_menu(self, position):
         """
@@ -577,33 +782,5 @@ class PresetManagerWidget(QWidget):
         if not item:
             return
 
-        # Create context menu
-        menu = QMenu(self)
-
-        # Add actions
-        load_action = QAction("Load", self)
-        load_action.triggered.connect(self.load_selected_preset)
-        menu.addAction(load_action)
-
-        edit_action = QAction("Edit", self)
-        edit_action.triggered.connect(self.edit_preset)
-        menu.addAction(edit_action)
-
-        export_action = QAction("Export", self)
-        export_action.triggered.connect(self.export_preset)
-        menu.addAction(export_action)
-
-        menu.addSeparator()
-
-        default_action = QAction("Set as Default", self)
-        default_action.triggered.connect(self.set_as_default)
-        menu.addAction(default_action)
-
-        menu.addSeparator()
-
-        delete_action = QAction("Delete", self)
-        delete_action.triggered.connect(self.delete_preset)
-        menu.addAction(delete_action)
-
-        # Show menu
-        menu.exec_(self.preset_list.mapToGlobal(position))
\ No newline at end of file
+        # Show the prebuilt menu
+        self._context_menu.exec_(self.preset_list.mapToGlobal(position))
\ No newline at end of file
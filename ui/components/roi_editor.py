@@ -8,13 +8,16 @@ Handles visual editing of ROIs and counting lines on video frames
 
 import cv2
 import numpy as np
+from collections import defaultdict
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QComboBox, QDialog, QFormLayout, QLineEdit, QDialogButtonBox,
     QGroupBox, QRadioButton, QFrame, QMessageBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint
-from PyQt5.QtGui import QColor, QPen, QPainter, QBrush, QMouseEvent, QImage
+from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QRect, QRectF, QTimer
+from PyQt5.QtGui import QColor, QPen, QPainter, QBrush, QMouseEvent, QImage, QPixmap
+
+from ui.components.roi_math_kernels import centroid, nearest_point, warmup_kernels
 
 
 class ROIEditorDialog(QDialog):
@@ -114,12 +117,93 @@ class ROIEditorDialog(QDialog):
         return properties
 
 
+# Qt >= 5.14 can wrap a BGR buffer directly, skipping the BGR->RGB
+# conversion pass entirely; older builds fall back to cvtColor
+_BGR888 = getattr(QImage, "Format_BGR888", None)
+
+# Grid hit-testing only pays off for large polygons; below this point
+# count the plain vectorized pass over all points is faster
+_GRID_INDEX_THRESHOLD = 64
+
+
+class _HoverIndex:
+    """Uniform grid over edit points for hit-testing large polygons
+
+    Bins point indices into cells sized to the hover radius so a mouse
+    event only tests the 3x3 cell neighborhood around the cursor instead
+    of every vertex.
+    """
+
+    def __init__(self, points, cell_size):
+        """
+        Build the grid
+
+        Args:
+            points: Sequence of (x, y) points
+            cell_size (int): Cell edge length, normally the hover radius
+        """
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        for i, (x, y) in enumerate(points):
+            self.cells[(x // cell_size, y // cell_size)].append(i)
+
+    def move(self, index, old_pos, new_pos):
+        """Update a single point's cell after a drag
+
+        Args:
+            index (int): Point index
+            old_pos (tuple): Previous (x, y)
+            new_pos (tuple): New (x, y)
+        """
+        cell = self.cell_size
+        old_key = (old_pos[0] // cell, old_pos[1] // cell)
+        new_key = (new_pos[0] // cell, new_pos[1] // cell)
+        if old_key == new_key:
+            return
+        bucket = self.cells[old_key]
+        bucket.remove(index)
+        if not bucket:
+            del self.cells[old_key]
+        self.cells[new_key].append(index)
+
+    def add(self, index, pos):
+        """Insert a newly appended point
+
+        Args:
+            index (int): Point index
+            pos (tuple): Point position (x, y)
+        """
+        cell = self.cell_size
+        self.cells[(pos[0] // cell, pos[1] // cell)].append(index)
+
+    def candidates(self, pos):
+        """Point indices in the 3x3 cell neighborhood of pos
+
+        Args:
+            pos (tuple): Cursor position (x, y)
+
+        Returns:
+            list: Candidate point indices
+        """
+        cell = self.cell_size
+        cx, cy = pos[0] // cell, pos[1] // cell
+        found = []
+        for kx in (cx - 1, cx, cx + 1):
+            for ky in (cy - 1, cy, cy + 1):
+                bucket = self.cells.get((kx, ky))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+
 class ROIEditorWidget(QWidget):
     """ROI Editor widget for editing ROIs and lines on video frames"""
 
     # Signals
-    roi_created = pyqtSignal(str, str, list, str)  # id, name, points, direction
-    roi_updated = pyqtSignal(str, str, list, str)  # id, name, points, direction
+    # Points travel as an int32 ndarray of shape (N, 2) so OpenCV-facing
+    # consumers can use them directly; call .tolist() where a list is needed
+    roi_created = pyqtSignal(str, str, object, str)  # id, name, points, direction
+    roi_updated = pyqtSignal(str, str, object, str)  # id, name, points, direction
     roi_deleted = pyqtSignal(str)  # id
 
     line_created = pyqtSignal(str, str, tuple, tuple, str)  # id, name, start_point, end_point, direction
@@ -144,10 +228,21 @@ class ROIEditorWidget(QWidget):
         self.current_roi_id = None
         self.current_line_id = None
         self.edit_points = []
+        self._pts_buf = np.empty((8, 2), np.int32)  # growable backing store
+        self._edit_pts_arr = None  # int32 view of edit_points for hit tests
+        self._hover_index = None   # grid index, built for large polygons only
         self.dragging_point_index = -1
         self.hovering_point_index = -1
         self.frame = None
         self.display_frame = None
+        self._base_frame = None  # frame + committed ROIs/lines; None means rebuild
+        self._display_buf = None  # persistent canvas reused by update_display_frame
+        self._paint_pending = False  # a coalesced mouse-move redraw is queued
+        self._dirty_rect = None      # region for the queued redraw; None = full
+        self._contour_cache = {}  # shape id -> (points ref, contour, label pos)
+        self._label_masks = {}    # label text -> rasterized stroke mask
+        self._rgb_cache = None   # reused BGR->RGB buffer; converted once per frame update
+        self._pixmap = None      # pixmap of the current frame, blitted by paintEvent
 
         # Drawing properties
         self.point_radius = 8
@@ -163,10 +258,20 @@ class ROIEditorWidget(QWidget):
         # Enable mouse tracking for hover effects
         self.setMouseTracking(True)
 
+        # Compile the geometry kernels now rather than on the first
+        # mouse event (no-op when numba is not installed)
+        warmup_kernels()
+
     def init_ui(self):
         """Initialize widget UI"""
         self.setMinimumSize(640, 480)
 
+        # paintEvent fully covers the widget with the frame pixmap, so
+        # Qt's pre-paint background erase is wasted bandwidth
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+
         # Layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -251,67 +356,137 @@ class ROIEditorWidget(QWidget):
             frame (numpy.ndarray): Video frame
         """
         self.frame = frame
+        self._base_frame = None
         self.update_display_frame()
 
-    def update_display_frame(self):
-        """Update display frame with ROIs and editing overlays"""
-        if self.frame is None:
-            return
+    def _rebuild_base_frame(self):
+        """Render the frame plus all committed ROIs and lines
 
+        This is the expensive layer (polylines + putText for every shape),
+        so it is rebuilt only when the frame, the shapes, or the selection
+        change; hover and drag redraws reuse it via update_display_frame.
+        """
         # Make a copy for drawing
-        self.display_frame = self.frame.copy()
-
-        # Draw all ROIs
+        self._base_frame = self.frame.copy()
+
+        # Group shapes by color so each group costs one cv2 call instead
+        # of one Python/C round trip per shape; names still need a
+        # putText each since text cannot be batched
+        # Contours are memoized per shape, keyed on the identity of the
+        # points list (every mutation path assigns a fresh list). Held on
+        # the widget rather than the roi dicts, which are serialized
+        # into presets as-is. Rebuilding the dict each pass evicts
+        # entries for deleted shapes.
+        contours = {}
+        roi_groups = {(0, 0, 255): [], (255, 165, 0): []}
         for roi_id, roi in self.roi_manager.rois.items():
             points = roi["points"]
             if len(points) >= 3:
                 color = (0, 0, 255) if roi_id == self.current_roi_id else (255, 165, 0)
-                cv2.polylines(
-                    self.display_frame,
-                    [np.array(points, np.int32)],
-                    True,
-                    color,
-                    2
-                )
-
-                # Draw ROI name
-                if len(points) > 0:
-                    centroid = np.mean(points, axis=0).astype(int)
-                    cv2.putText(
-                        self.display_frame,
-                        roi["name"],
-                        (centroid[0], centroid[1]),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.6,
-                        color,
-                        2
-                    )
-
-        # Draw all counting lines
+                cached = self._contour_cache.get(roi_id)
+                if cached is None or cached[0] is not points:
+                    contour = np.asarray(points, np.int32)
+                    cached = (points, contour, centroid(contour))
+                contours[roi_id] = cached
+                roi_groups[color].append(cached[1])
+
+                # Draw ROI name at the cached centroid
+                self._blit_label(roi["name"], color, cached[2])
+
+        for color, polys in roi_groups.items():
+            if polys:
+                cv2.polylines(self._base_frame, polys, True, color, 2)
+
+        # Same batching for counting lines, as open 2-point polylines
+        line_groups = {(0, 0, 255): [], (0, 255, 255): []}
         for line_id, line in self.roi_manager.counting_lines.items():
             points = line["points"]
             if len(points) == 2:
                 color = (0, 0, 255) if line_id == self.current_line_id else (0, 255, 255)
-                cv2.line(
-                    self.display_frame,
-                    points[0],
-                    points[1],
-                    color,
-                    2
-                )
+                cached = self._contour_cache.get(line_id)
+                if cached is None or cached[0] is not points:
+                    mid_x = (points[0][0] + points[1][0]) // 2
+                    mid_y = (points[0][1] + points[1][1]) // 2
+                    cached = (points, np.asarray(points, np.int32),
+                              (mid_x, mid_y - 10))
+                contours[line_id] = cached
+                line_groups[color].append(cached[1])
 
-                # Draw line name
-                mid_x = (points[0][0] + points[1][0]) // 2
-                mid_y = (points[0][1] + points[1][1]) // 2
-                cv2.putText(
-                    self.display_frame,
-                    line["name"],
-                    (mid_x, mid_y - 10),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    color,
-                    2
-                )
+                # Draw line name at the cached midpoint
+                self._blit_label(line["name"], color, cached[2])
+
+        for color, segments in line_groups.items():
+            if segments:
+                cv2.polylines(self._base_frame, segments, False, color, 2)
+
+        self._contour_cache = contours
+
+    def _blit_label(self, name, color, anchor):
+        """Stamp a shape label onto the base frame
+
+        cv2.putText rasterizes every glyph on each call; instead the
+        label's stroke mask is rendered once per text and stamped in the
+        requested color, so renames pay the rasterization and rebuilds
+        pay only a small masked assignment.
+
+        Args:
+            name (str): Label text
+            color (tuple): BGR color
+            anchor (tuple): Baseline-left position (x, y)
+        """
+        cached = self._label_masks.get(name)
+        if cached is None:
+            (tw, th), baseline = cv2.getTextSize(
+                name, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+            canvas = np.zeros((th + baseline, max(tw, 1)), np.uint8)
+            cv2.putText(canvas, name, (0, th),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, 255, 2)
+            cached = (canvas > 0, th)
+            self._label_masks[name] = cached
+        mask, text_height = cached
+
+        # The anchor is the text baseline, so the tile spans from
+        # text_height above it down to the descender rows below
+        x, y = anchor
+        y0 = y - text_height
+        x0 = x
+        y1 = y0 + mask.shape[0]
+        x1 = x0 + mask.shape[1]
+
+        # Clip to the frame
+        fh, fw = self._base_frame.shape[:2]
+        fy0, fx0 = max(0, y0), max(0, x0)
+        fy1, fx1 = min(fh, y1), min(fw, x1)
+        if fy1 <= fy0 or fx1 <= fx0:
+            return
+
+        sub = mask[fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0]
+        self._base_frame[fy0:fy1, fx0:fx1][sub] = color
+
+    def update_display_frame(self, dirty=None):
+        """Update display frame with ROIs and editing overlays
+
+        Copies the cached base layer and draws only the in-progress edit
+        points on top, so hover-only redraws cost one copy plus a few
+        circle draws.
+
+        Args:
+            dirty (QRect): Widget region to invalidate, or None for all
+        """
+        if self.frame is None:
+            return
+
+        if self._base_frame is None:
+            self._rebuild_base_frame()
+
+        # Reuse one canvas instead of allocating a fresh frame-sized
+        # buffer on every hover redraw; the pixmap below copies out of
+        # it, so overwriting it next pass is safe
+        if (self._display_buf is None
+                or self._display_buf.shape != self._base_frame.shape):
+            self._display_buf = np.empty_like(self._base_frame)
+        np.copyto(self._display_buf, self._base_frame)
+        self.display_frame = self._display_buf
 
         # Draw editing points
         if self.editing_mode and self.edit_points:
@@ -346,24 +521,118 @@ class ROIEditorWidget(QWidget):
                     -1
                 )
 
-        # Request repaint
-        self.update()
+        # Wrap the BGR frame in a QImage and up to a pixmap once per
+        # display update; repaints triggered by exposes or hover-only
+        # updates just blit the cached pixmap, which the paint backend
+        # can scale cheaply. fromImage copies, so the wrapped numpy
+        # buffer only has to outlive this call.
+        h, w = self.display_frame.shape[:2]
+        if _BGR888 is not None:
+            image = QImage(self.display_frame.data, w, h,
+                           self.display_frame.strides[0], _BGR888)
+        else:
+            # Older Qt has no BGR format; convert into a reused buffer
+            if self._rgb_cache is None or self._rgb_cache.shape[:2] != (h, w):
+                self._rgb_cache = np.empty_like(self.display_frame)
+            cv2.cvtColor(self.display_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_cache)
+            image = QImage(self._rgb_cache.data, w, h, 3 * w, QImage.Format_RGB888)
+        self._pixmap = QPixmap.fromImage(image)
+
+        # Request repaint of just the changed region when known
+        if dirty is None:
+            self.update()
+        else:
+            self.update(dirty)
 
     def paintEvent(self, event):
-        """Paint widget with current frame"""
-        if self.display_frame is not None:
-            painter = QPainter(self)
+        """Paint widget with the cached frame pixmap"""
+        if self._pixmap is None:
+            return
+
+        painter = QPainter(self)
+        target = event.rect()
+        if target == self.rect():
+            painter.drawPixmap(self.rect(), self._pixmap)
+            return
+
+        # Partial (dirty-rect) repaint: map the widget region back to
+        # pixmap coordinates so scaling stays consistent
+        sx = self._pixmap.width() / self.width()
+        sy = self._pixmap.height() / self.height()
+        source = QRectF(target.x() * sx, target.y() * sy,
+                        target.width() * sx, target.height() * sy)
+        painter.drawPixmap(QRectF(target), self._pixmap, source)
+
+    def _sync_edit_pts_arr(self):
+        """Refill the int32 mirror after a bulk edit_points change
+
+        The mirror is a view into a capacity-doubled backing buffer, so
+        bulk loads only reallocate when the polygon outgrows it.
+        """
+        count = len(self.edit_points)
+        if count:
+            if self._pts_buf.shape[0] < count:
+                capacity = 1 << (count - 1).bit_length()
+                self._pts_buf = np.empty((capacity, 2), np.int32)
+            self._pts_buf[:count] = self.edit_points
+            self._edit_pts_arr = self._pts_buf[:count]
+        else:
+            self._edit_pts_arr = None
+
+        # Large imported polygons get a grid index so hover tests touch
+        # only the cursor's cell neighborhood
+        if count > _GRID_INDEX_THRESHOLD:
+            self._hover_index = _HoverIndex(self.edit_points, self.hover_radius)
+        else:
+            self._hover_index = None
+
+    def _append_edit_point(self, pos):
+        """Append one point, amortized O(1) on the array mirror
+
+        Args:
+            pos (tuple): Point position (x, y)
+        """
+        index = len(self.edit_points)
+        self.edit_points.append(pos)
+
+        if self._pts_buf.shape[0] <= index:
+            grown = np.empty((self._pts_buf.shape[0] * 2, 2), np.int32)
+            grown[:index] = self._pts_buf[:index]
+            self._pts_buf = grown
+        self._pts_buf[index] = pos
+        self._edit_pts_arr = self._pts_buf[:index + 1]
+
+        if self._hover_index is not None:
+            self._hover_index.add(index, pos)
+        elif index + 1 > _GRID_INDEX_THRESHOLD:
+            self._hover_index = _HoverIndex(self.edit_points, self.hover_radius)
+
+    def _hit_test(self, pos):
+        """Find the edit point under the cursor
+
+        One vectorized squared-distance pass over all points instead of a
+        Python loop with per-point sqrt calls.
+
+        Args:
+            pos (tuple): Cursor position (x, y)
 
-            # Convert frame to Qt format and draw
-            h, w, c = self.display_frame.shape
-            bytes_per_line = 3 * w
+        Returns:
+            int: Index of the hit point, or -1 if none within hover_radius
+        """
+        arr = self._edit_pts_arr
+        if arr is None:
+            return -1
 
-            # Convert BGR to RGB
-            rgb_image = cv2.cvtColor(self.display_frame, cv2.COLOR_BGR2RGB)
+        if self._hover_index is not None:
+            candidates = self._hover_index.candidates(pos)
+            if not candidates:
+                return -1
+            arr = arr[candidates]
 
-            # Create QImage and draw
-            q_img = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            painter.drawImage(self.rect(), q_img)
+        idx, d2 = nearest_point(arr, pos[0], pos[1])
+        if idx < 0 or d2 > self.hover_radius ** 2:
+            return -1
+        return candidates[idx] if self._hover_index is not None else idx
 
     def mousePressEvent(self, event):
         """Handle mouse press events"""
@@ -373,24 +642,20 @@ class ROIEditorWidget(QWidget):
         # Get mouse position
         pos = (event.x(), event.y())
 
-        # Check if clicking on an existing point
-        for i, point in enumerate(self.edit_points):
-            # Calculate distance
-            dist = np.sqrt((pos[0] - point[0])**2 + (pos[1] - point[1])**2)
-
-            # If clicking on a point, start dragging
-            if dist <= self.hover_radius:
-                self.dragging_point_index = i
-                return
+        # If clicking on an existing point, start dragging
+        hit_index = self._hit_test(pos)
+        if hit_index >= 0:
+            self.dragging_point_index = hit_index
+            return
 
         # If not clicking on a point, add a new one
         if self.editing_mode == "roi":
             # For ROI, always add point
-            self.edit_points.append(pos)
+            self._append_edit_point(pos)
             self.update_display_frame()
         elif self.editing_mode == "line" and len(self.edit_points) < 2:
             # For line, add up to 2 points
-            self.edit_points.append(pos)
+            self._append_edit_point(pos)
             self.update_display_frame()
 
     def mouseMoveEvent(self, event):
@@ -403,26 +668,82 @@ class ROIEditorWidget(QWidget):
 
         # If dragging a point, update its position
         if self.dragging_point_index >= 0:
-            self.edit_points[self.dragging_point_index] = pos
-            self.update_display_frame()
+            if self._hover_index is not None:
+                self._hover_index.move(
+                    self.dragging_point_index,
+                    self.edit_points[self.dragging_point_index],
+                    pos
+                )
+            # The dragged marker and the edges into its neighbors are
+            # the only pixels that move
+            index = self.dragging_point_index
+            count = len(self.edit_points)
+            dirty = self._cursor_rect(self.edit_points[index]).united(
+                self._cursor_rect(pos))
+            for j in (index - 1, index + 1):
+                if self.editing_mode == "roi":
+                    dirty = dirty.united(
+                        self._cursor_rect(self.edit_points[j % count]))
+                elif 0 <= j < count:
+                    dirty = dirty.united(
+                        self._cursor_rect(self.edit_points[j]))
+
+            self.edit_points[index] = pos
+            self._edit_pts_arr[index] = pos
+            self._schedule_repaint(dirty)
             return
 
         # Check if hovering over an existing point
         prev_hover_index = self.hovering_point_index
-        self.hovering_point_index = -1
+        self.hovering_point_index = self._hit_test(pos)
 
-        for i, point in enumerate(self.edit_points):
-            # Calculate distance
-            dist = np.sqrt((pos[0] - point[0])**2 + (pos[1] - point[1])**2)
+        # Update display if hover state changed; only the markers that
+        # swapped color need repainting
+        if prev_hover_index != self.hovering_point_index:
+            dirty = QRect()
+            for index in (prev_hover_index, self.hovering_point_index):
+                if 0 <= index < len(self.edit_points):
+                    dirty = dirty.united(
+                        self._cursor_rect(self.edit_points[index]))
+            self._schedule_repaint(dirty)
 
-            # If hovering over a point
-            if dist <= self.hover_radius:
-                self.hovering_point_index = i
-                break
+    def _cursor_rect(self, pos):
+        """Widget region covering a point marker at pos
 
-        # Update display if hover state changed
-        if prev_hover_index != self.hovering_point_index:
-            self.update_display_frame()
+        Args:
+            pos (tuple): Marker position (x, y)
+
+        Returns:
+            QRect: Marker bounds plus a small margin
+        """
+        margin = self.hover_radius + 4
+        return QRect(pos[0] - margin, pos[1] - margin, 2 * margin, 2 * margin)
+
+    def _schedule_repaint(self, dirty=None):
+        """Queue one coalesced redraw for a burst of mouse moves
+
+        Mice report at up to 1000 Hz, far above what the display can
+        show; moves that land while a redraw is queued only union their
+        dirty regions into that one redraw.
+
+        Args:
+            dirty (QRect): Changed region, or None for a full repaint
+        """
+        if not self._paint_pending:
+            self._dirty_rect = dirty
+            self._paint_pending = True
+            QTimer.singleShot(0, self._do_repaint)
+        elif self._dirty_rect is not None:
+            # Widen the queued region; a queued full repaint stays full
+            self._dirty_rect = (self._dirty_rect.united(dirty)
+                                if dirty is not None else None)
+
+    def _do_repaint(self):
+        """Run the queued redraw"""
+        self._paint_pending = False
+        dirty = self._dirty_rect
+        self._dirty_rect = None
+        self.update_display_frame(dirty)
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events"""
@@ -443,6 +764,8 @@ class ROIEditorWidget(QWidget):
         self.editing_mode = "roi"
         self.current_roi_id = None
         self.edit_points = []
+        self._sync_edit_pts_arr()
+        self._base_frame = None
         self.update_button_states()
         self.update_status("Click to add points, double-click to finish")
 
@@ -460,6 +783,8 @@ class ROIEditorWidget(QWidget):
         self.editing_mode = "roi"
         self.current_roi_id = roi_id
         self.edit_points = self.roi_manager.rois[roi_id]["points"].copy()
+        self._sync_edit_pts_arr()
+        self._base_frame = None
 
         self.update_button_states()
         self.update_status("Edit ROI points, double-click to finish")
@@ -470,6 +795,8 @@ class ROIEditorWidget(QWidget):
         self.editing_mode = "line"
         self.current_line_id = None
         self.edit_points = []
+        self._sync_edit_pts_arr()
+        self._base_frame = None
         self.update_button_states()
         self.update_status("Click to add start point, then end point")
 
@@ -487,6 +814,8 @@ class ROIEditorWidget(QWidget):
         self.editing_mode = "line"
         self.current_line_id = line_id
         self.edit_points = self.roi_manager.counting_lines[line_id]["points"].copy()
+        self._sync_edit_pts_arr()
+        self._base_frame = None
 
         self.update_button_states()
         self.update_status("Edit line points")
@@ -506,6 +835,7 @@ class ROIEditorWidget(QWidget):
                 self.roi_manager.delete_roi(roi_id)
                 self.roi_deleted.emit(roi_id)
                 self.update_roi_combo()
+                self._base_frame = None
                 self.update_display_frame()
                 return
 
@@ -521,6 +851,7 @@ class ROIEditorWidget(QWidget):
                 self.roi_manager.delete_counting_line(line_id)
                 self.line_deleted.emit(line_id)
                 self.update_line_combo()
+                self._base_frame = None
                 self.update_display_frame()
 
     def finish_roi_editing(self):
@@ -558,7 +889,8 @@ class ROIEditorWidget(QWidget):
                     props["direction"]
                 )
 
-            self.roi_updated.emit(roi_id, props["name"], self.edit_points, props["direction"])
+            self.roi_updated.emit(
+                roi_id, props["name"], self._edit_pts_arr.copy(), props["direction"])
         else:
             # Create new ROI
             roi_id = self.roi_manager.create_roi(
@@ -566,17 +898,20 @@ class ROIEditorWidget(QWidget):
                 self.edit_points,
                 props["direction"]
             )
-            self.roi_created.emit(roi_id, props["name"], self.edit_points, props["direction"])
+            self.roi_created.emit(
+                roi_id, props["name"], self._edit_pts_arr.copy(), props["direction"])
 
         # Exit editing mode
         self.editing_mode = None
         self.current_roi_id = None
         self.edit_points = []
+        self._sync_edit_pts_arr()
 
         # Update UI
         self.update_roi_combo()
         self.update_button_states()
         self.update_status("ROI saved")
+        self._base_frame = None
         self.update_display_frame()
 
     def finish_line_editing(self):
@@ -643,11 +978,13 @@ class ROIEditorWidget(QWidget):
         self.editing_mode = None
         self.current_line_id = None
         self.edit_points = []
+        self._sync_edit_pts_arr()
 
         # Update UI
         self.update_line_combo()
         self.update_button_states()
         self.update_status("Counting line saved")
+        self._base_frame = None
         self.update_display_frame()
 
     def finish_editing(self):
@@ -676,9 +1013,11 @@ class ROIEditorWidget(QWidget):
         self.current_roi_id = None
         self.current_line_id = None
         self.edit_points = []
+        self._sync_edit_pts_arr()
 
         self.update_button_states()
         self.update_status("Editing cancelled")
+        self._base_frame = None
         self.update_display_frame()
 
         # Signal that editing is cancelled
@@ -723,6 +1062,7 @@ class ROIEditorWidget(QWidget):
         roi_id = self.roi_combo.itemData(index)
         self.current_roi_id = roi_id
         self.current_line_id = None
+        self._base_frame = None
         self.update_display_frame()
 
     def on_line_selected(self, index):
@@ -730,6 +1070,7 @@ class ROIEditorWidget(QWidget):
         line_id = self.line_combo.itemData(index)
         self.current_line_id = line_id
         self.current_roi_id = None
+        self._base_frame = None
         self.update_display_frame()
 
     def update_status(self, message):
@@ -6,7 +6,6 @@ Video stream view component for Vehicle Counter application
 Displays video stream with detections and counting visualizations
 """
 import logging
-import traceback
 
 import cv2
 import numpy as np
@@ -14,17 +13,48 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QSizePolicy, QMessageBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QRect, QSize
-from PyQt5.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QFont
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QObject, QPoint, QRect, QSize, QThread, QTimer
+)
+from PyQt5.QtGui import (
+    QImage, QPixmap, QPainter, QPen, QColor, QFont, QPolygon
+)
 
 logger = logging.getLogger(__name__)
 
 
+class _ConvertWorker(QObject):
+    """Runs the CPU side of frame conversion on a worker thread
+
+    The GUI thread only ever touches the finished QImage; the overlay
+    draw, contiguity fix-up and channel handling all happen here.
+    """
+
+    # (q_img, backing array, job tuple the image was built from)
+    ready = pyqtSignal(object, object, object)
+
+    def __init__(self, convert_fn):
+        super().__init__()
+        self._convert = convert_fn
+
+    def process(self, job):
+        """Convert one queued frame job and emit the result"""
+        try:
+            result = self._convert(job)
+        except Exception as e:
+            # exc_info defers traceback formatting to the handler
+            logger.error(f"Error converting frame: {str(e)}", exc_info=True)
+            # Still report back so the view never stays marked busy
+            result = (None, None, job)
+        self.ready.emit(*result)
+
+
 class VideoStreamView(QWidget):
     """Video stream view component"""
 
     # Signals
     roi_point_added = pyqtSignal(tuple)  # (x, y)
+    _convert_request = pyqtSignal(object)  # job tuple for the worker
 
     def __init__(self, parent=None):
         """Initialize stream view"""
@@ -33,6 +63,7 @@ class VideoStreamView(QWidget):
         # Frame data
         self.frame = None
         self.scaled_frame = None
+        self._pixmap_key = None
         self.frame_size = QSize(640, 480)
         self.source_frame_size = (640, 480)
 
@@ -49,6 +80,8 @@ class VideoStreamView(QWidget):
         self.source_info = {}
         self.show_info = True
         self.show_grid = False
+        self._bgrx = None              # reused BGRX pack buffer (worker)
+        self._src_buf = None           # reused ingest downscale buffer
 
         # Initialize UI
         self.init_ui()
@@ -56,6 +89,28 @@ class VideoStreamView(QWidget):
         # Set mouse tracking for hover effects in editing mode
         self.setMouseTracking(True)
 
+        # Coalesce incoming frames to the display cadence: sources can
+        # push faster than the screen refreshes, and conversions beyond
+        # that rate are discarded by the compositor anyway
+        self._pending_frame = None
+        self._display_timer = QTimer(self)
+        self._display_timer.setInterval(33)
+        self._display_timer.timeout.connect(self._show_pending_frame)
+        self._display_timer.start()
+
+        # Frame conversion runs on a worker thread so a 1080p overlay
+        # pass or channel flip never stalls input handling; the queued
+        # signal hop delivers only the finished QImage back here
+        self._convert_busy = False
+        self._convert_pending = None
+        self._convert_thread = QThread(self)
+        self._convert_worker = _ConvertWorker(self._convert_job)
+        self._convert_worker.moveToThread(self._convert_thread)
+        self._convert_request.connect(self._convert_worker.process)
+        self._convert_worker.ready.connect(self._apply_converted)
+        self.destroyed.connect(self._convert_thread.quit)
+        self._convert_thread.start()
+
     def init_ui(self):
         """Initialize UI components"""
         # Main layout
@@ -72,6 +127,10 @@ class VideoStreamView(QWidget):
         # Add click handler to frame widget
         self.frame_widget.mousePressEvent = self.on_frame_click
 
+        # Paint the editing overlay on top of the label's own paint,
+        # same hook style as the click handler above
+        self.frame_widget.paintEvent = self._paint_frame_widget
+
         self.main_layout.addWidget(self.frame_widget)
 
         # Status bar
@@ -94,7 +153,10 @@ class VideoStreamView(QWidget):
 
     def update_frame(self, frame):
         """
-        Update video frame
+        Queue a video frame for display
+
+        Frames are coalesced to the display timer's cadence; when the
+        source outruns it, only the newest frame is converted and shown.
 
         Args:
             frame (numpy.ndarray): Video frame to display
@@ -103,14 +165,24 @@ class VideoStreamView(QWidget):
             logger.error("Received None frame in update_frame")
             return
 
-        try:
-            # Store original frame
-            self.frame = frame.copy()  # Explicit copy to avoid reference issues
+        if len(frame.shape) < 3:
+            logger.error(f"Invalid frame shape: {frame.shape}")
+            return
 
-            # Get frame dimensions
-            if len(frame.shape) < 3:
-                logger.error(f"Invalid frame shape: {frame.shape}")
-                return
+        self._pending_frame = frame
+
+    def _show_pending_frame(self):
+        """Display the most recently queued frame, if any"""
+        frame = self._pending_frame
+        if frame is None:
+            return
+        self._pending_frame = None
+
+        try:
+            # Store the frame as-is: the processing thread emits an owned
+            # copy per frame and never touches it again, so copying here
+            # again was pure memory traffic
+            self.frame = frame
 
             h, w, c = frame.shape
             self.source_frame_size = (w, h)
@@ -125,80 +197,154 @@ class VideoStreamView(QWidget):
             if self.editing_enabled and self.roi_manager:
                 self.draw_editing_overlay()
         except Exception as e:
-            logger.error(f"Error in update_frame: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.error(f"Error in update_frame: {str(e)}", exc_info=True)
 
     def convert_frame_to_pixmap(self):
-        """Convert current frame to QPixmap and display"""
+        """Convert current frame to QPixmap and display
+
+        Hands the CPU work to the conversion worker; the pixmap appears
+        once the worker's result arrives back on the GUI thread.
+        """
         if self.frame is None:
             return
 
-        # Make a copy of the frame
-        disp_frame = self.frame.copy()
-
-        # Draw information overlay if enabled
-        if self.show_info:
-            self.draw_info_overlay(disp_frame)
+        # Reuse the last pixmap when nothing feeding it changed; holding
+        # the frame reference in the key keeps the identity check safe.
+        # The widget size is snapshotted here so the worker never reads
+        # live widget geometry off the GUI thread.
+        widget_size = (self.frame_widget.width(), self.frame_widget.height())
+        key = (self.frame, self.show_info, self.show_grid, widget_size)
+        if (self._pixmap_key is not None
+                and key[0] is self._pixmap_key[0]
+                and key[1:] == self._pixmap_key[1:]):
+            self.frame_widget.setPixmap(self.scaled_frame)
+            return
 
-        # Convert BGR to RGB for Qt
-        rgb_frame = cv2.cvtColor(disp_frame, cv2.COLOR_BGR2RGB)
+        # One job in flight at a time; a newer request simply replaces
+        # the parked one, same as the frame coalescing above
+        if self._convert_busy:
+            self._convert_pending = key
+        else:
+            self._convert_busy = True
+            self._convert_request.emit(key)
 
-        # Get frame dimensions
-        h, w, c = rgb_frame.shape
-        bytes_per_line = c * w
+    def _convert_job(self, job):
+        """Build a QImage for one frame (worker thread)
 
-        # Create QImage
-        q_img = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
+        Args:
+            job (tuple): (frame, show_info, show_grid, widget_size)
 
-        # Scale image to fit widget if needed
-        scaled_pixmap = QPixmap.fromImage(q_img)
-        self.scaled_frame = scaled_pixmap
+        Returns:
+            tuple: (q_img, backing array, job)
+        """
+        frame, show_info, show_grid, widget_size = job
 
-        # Display image
-        self.frame_widget.setPixmap(scaled_pixmap)
+        # Downscale heavily oversized sources (e.g. 4K into a 720p
+        # widget) before anything else: the overlay copy, BGRX pack and
+        # pixmap upload below then touch a fraction of the pixels.
+        # INTER_AREA is the right filter for a >=2x shrink.
+        h, w = frame.shape[:2]
+        max_widget = max(widget_size)
+        if max_widget > 0 and max(w, h) > 2 * max_widget:
+            scale = max_widget / max(w, h)
+            target = (max(1, int(w * scale)), max(1, int(h * scale)))
+            if (self._src_buf is None
+                    or self._src_buf.shape[:2] != (target[1], target[0])):
+                self._src_buf = np.empty((target[1], target[0], 3), np.uint8)
+            cv2.resize(frame, target, dst=self._src_buf,
+                       interpolation=cv2.INTER_AREA)
+            frame = self._src_buf
+
+        # Copy only when the grid will actually draw on the pixels
+        if show_info and show_grid:
+            disp_frame = frame.copy()
+            self.draw_info_overlay(disp_frame)
+        else:
+            disp_frame = frame
+
+        # QImage needs a contiguous buffer; frames straight from OpenCV
+        # already are, so this is normally free
+        if not disp_frame.flags["C_CONTIGUOUS"]:
+            disp_frame = np.ascontiguousarray(disp_frame)
+
+        # Pack into 32-bit BGRX, the layout QPixmap stores natively, so
+        # the later fromImage is a plain memcpy instead of a scanline
+        # repack. The buffer is reused across frames: the busy flag
+        # guarantees the GUI consumed the previous QImage before the
+        # next job starts writing here.
+        h, w = disp_frame.shape[:2]
+        if self._bgrx is None or self._bgrx.shape[:2] != (h, w):
+            self._bgrx = np.empty((h, w, 4), np.uint8)
+        cv2.cvtColor(disp_frame, cv2.COLOR_BGR2BGRA, dst=self._bgrx)
+        q_img = QImage(self._bgrx.data, w, h, w * 4, QImage.Format_RGB32)
+
+        return q_img, self._bgrx, job
+
+    def _apply_converted(self, q_img, backing, key):
+        """Show a finished conversion result (GUI thread)"""
+        if q_img is not None:
+            self._qimage_backing = backing
+            scaled_pixmap = QPixmap.fromImage(q_img)
+            self.scaled_frame = scaled_pixmap
+            self._pixmap_key = key
+            self.frame_widget.setPixmap(scaled_pixmap)
+
+        self._convert_busy = False
+        if self._convert_pending is not None:
+            job = self._convert_pending
+            self._convert_pending = None
+            self._convert_busy = True
+            self._convert_request.emit(job)
 
     def draw_info_overlay(self, frame):
         """
-        Draw information overlay on frame
+        Draw the grid overlay on frame
+
+        The source banner is painted at widget level instead (see
+        _paint_frame_widget), so text never touches the frame ndarray.
 
         Args:
             frame (numpy.ndarray): Frame to draw on
         """
-        h, w = frame.shape[:2]
-
-        # Draw source info
-        if self.source_info:
-            y_pos = 30
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            font_scale = 0.6
-            color = (255, 255, 255)
-            thickness = 1
-
-            # Draw black background
-            info_text = f"Source: {self.source_info.get('source_path', 'Unknown')}"
-            (text_w, text_h), _ = cv2.getTextSize(info_text, font, font_scale, thickness)
-            cv2.rectangle(frame, (10, y_pos - text_h - 5), (10 + text_w + 10, y_pos + 5), (0, 0, 0), -1)
-
-            # Draw text
-            cv2.putText(frame, info_text, (15, y_pos), font, font_scale, color, thickness)
-
-        # Draw grid if enabled
+        # Two strided numpy writes touch only the grid pixels
+        # themselves, cheaper than any full-frame pass
         if self.show_grid:
-            # Draw vertical lines
-            for x in range(0, w, 100):
-                cv2.line(frame, (x, 0), (x, h), (40, 40, 40), 1)
-
-            # Draw horizontal lines
-            for y in range(0, h, 100):
-                cv2.line(frame, (0, y), (w, y), (40, 40, 40), 1)
+            frame[::100, :] = (40, 40, 40)
+            frame[:, ::100] = (40, 40, 40)
 
     def draw_editing_overlay(self):
-        """Draw ROI editing overlay on displayed frame"""
-        if not self.scaled_frame:
+        """Schedule a repaint of the ROI editing overlay
+
+        The overlay is painted directly on the label by
+        _paint_frame_widget, so edit clicks no longer mutate the scaled
+        pixmap and push it through setPixmap again.
+        """
+        self.frame_widget.update()
+
+    def _paint_frame_widget(self, event):
+        """Label paintEvent hook: default paint plus overlays"""
+        QLabel.paintEvent(self.frame_widget, event)
+
+        # Source banner drawn at widget level: Qt caches the glyph
+        # raster, and the frame ndarray stays untouched
+        if self.show_info and self.source_info:
+            painter = QPainter(self.frame_widget)
+            try:
+                info_text = f"Source: {self.source_info.get('source_path', 'Unknown')}"
+                rect = painter.fontMetrics().boundingRect(info_text)
+                rect.adjust(-5, -5, 5, 5)
+                rect.moveTopLeft(QPoint(10, 10))
+                painter.fillRect(rect, QColor(0, 0, 0))
+                painter.setPen(QColor(255, 255, 255))
+                painter.drawText(rect, Qt.AlignCenter, info_text)
+            finally:
+                painter.end()
+
+        if not (self.editing_enabled and self.roi_manager):
             return
 
         # Create painter for overlay
-        painter = QPainter(self.scaled_frame)
+        painter = QPainter(self.frame_widget)
 
         try:
             # Draw edit mode indicator
@@ -218,41 +364,57 @@ class VideoStreamView(QWidget):
 
             # Draw current ROI manager points if available
             if self.roi_manager and self.roi_manager.temp_points:
-                # Draw points
-                for point in self.roi_manager.temp_points:
-                    painter.setPen(QPen(QColor(0, 0, 255), 2))
-                    painter.setBrush(QColor(0, 0, 255, 128))
-                    painter.drawEllipse(QPoint(point[0], point[1]), 8, 8)
+                # Materialize the points once, mapped from source-frame
+                # back to widget coordinates; they feed both the markers
+                # and the batched polyline below
+                sx, sy, ox, oy = self._overlay_transform()
+                pts = [QPoint(int(x / sx + ox), int(y / sy + oy))
+                       for x, y in self.roi_manager.temp_points]
 
-                # Draw lines connecting points
-                if len(self.roi_manager.temp_points) > 1:
+                # Draw points
+                painter.setPen(QPen(QColor(0, 0, 255), 2))
+                painter.setBrush(QColor(0, 0, 255, 128))
+                for point in pts:
+                    painter.drawEllipse(point, 8, 8)
+
+                # Draw lines connecting points in one call: Qt's path
+                # rasterizer handles the whole chain instead of N
+                # per-segment round trips
+                if len(pts) > 1:
                     painter.setPen(QPen(QColor(255, 0, 0), 2))
 
-                    # For ROI, draw polygon
                     if self.editing_mode == "roi":
-                        for i in range(1, len(self.roi_manager.temp_points)):
-                            p1 = self.roi_manager.temp_points[i-1]
-                            p2 = self.roi_manager.temp_points[i]
-                            painter.drawLine(QPoint(p1[0], p1[1]), QPoint(p2[0], p2[1]))
+                        painter.drawPolyline(QPolygon(pts))
 
                         # Close polygon if 3+ points
-                        if len(self.roi_manager.temp_points) >= 3:
-                            p1 = self.roi_manager.temp_points[-1]
-                            p2 = self.roi_manager.temp_points[0]
+                        if len(pts) >= 3:
                             painter.setPen(QPen(QColor(255, 0, 0, 128), 2, Qt.DashLine))
-                            painter.drawLine(QPoint(p1[0], p1[1]), QPoint(p2[0], p2[1]))
+                            painter.drawLine(pts[-1], pts[0])
 
                     # For line, just connect two points
-                    elif self.editing_mode == "line" and len(self.roi_manager.temp_points) == 2:
-                        p1 = self.roi_manager.temp_points[0]
-                        p2 = self.roi_manager.temp_points[1]
-                        painter.drawLine(QPoint(p1[0], p1[1]), QPoint(p2[0], p2[1]))
+                    elif self.editing_mode == "line" and len(pts) == 2:
+                        painter.drawLine(pts[0], pts[1])
 
         finally:
             painter.end()
 
-        # Update display
-        self.frame_widget.setPixmap(self.scaled_frame)
+    def _overlay_transform(self):
+        """Widget-to-source mapping as (scale_x, scale_y, offset_x, offset_y)
+
+        The label shows the pixmap 1:1 center-aligned, so the scales are
+        the source/pixmap ratio (normally 1.0) and the offsets are the
+        centering margins. Derived from live geometry each call so a
+        window resize never leaves a stale transform behind.
+        """
+        pixmap = self.scaled_frame
+        if pixmap is None or pixmap.isNull():
+            return 1.0, 1.0, 0, 0
+        src_w, src_h = self.source_frame_size
+        scale_x = src_w / pixmap.width()
+        scale_y = src_h / pixmap.height()
+        offset_x = (self.frame_widget.width() - pixmap.width()) // 2
+        offset_y = (self.frame_widget.height() - pixmap.height()) // 2
+        return scale_x, scale_y, offset_x, offset_y
 
     def on_frame_click(self, event):
         """
@@ -264,8 +426,10 @@ class VideoStreamView(QWidget):
         if not self.editing_enabled or not self.roi_manager:
             return
 
-        # Get click position
-        pos = (event.x(), event.y())
+        # Store clicks in source-frame coordinates so ROI points stay
+        # pinned to the video rather than to widget pixels
+        sx, sy, ox, oy = self._overlay_transform()
+        pos = (int((event.x() - ox) * sx), int((event.y() - oy) * sy))
 
         # Handle right-click to finish ROI
         if event.button() == Qt.RightButton and self.editing_mode == "roi":
@@ -310,6 +474,10 @@ class VideoStreamView(QWidget):
         self.source_frame_size = (w, h)
         self.resolution_label.setText(f"Resolution: {w}x{h}")
 
+        # The banner is painted by _paint_frame_widget, so a new source
+        # just needs a repaint
+        self.frame_widget.update()
+
     def enable_editing(self, enabled, mode=None):
         """
         Enable or disable ROI editing mode
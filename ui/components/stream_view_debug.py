@@ -7,7 +7,7 @@ import logging
 import time
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFrame, QSizePolicy, QMessageBox, QApplication
+    QFrame, QSizePolicy, QMessageBox
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QRect, QSize, QTimer
 from PyQt5.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QFont
@@ -28,6 +28,10 @@ class VideoStreamView(QWidget):
         # Frame data
         self.frame = None
         self.scaled_frame = None
+        self._pixmap_set = False
+        self._resize_buf = None   # reused buffer for the display downscale
+        self._display_buf = None  # reused canvas for overlay drawing
+        self._bgrx = None         # reused BGRX pack buffer
         self.frame_size = QSize(640, 480)
         self.source_frame_size = (640, 480)
 
@@ -44,6 +48,8 @@ class VideoStreamView(QWidget):
         self.source_info = {}
         self.show_info = True
         self.show_grid = False
+        self._info_sprite = None       # prerendered source banner
+        self._info_sprite_key = None
 
         # Debug flag and counters
         self.debug_mode = True
@@ -66,10 +72,11 @@ class VideoStreamView(QWidget):
         # Set mouse tracking for hover effects in editing mode
         self.setMouseTracking(True)
 
-        # Refresh timer for UI
+        # Fallback refresh timer: real frames drive the display, so this
+        # only needs to catch the rare case where nothing got shown
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.refresh_display)
-        self.refresh_timer.start(500)  # Refresh every 500ms
+        self.refresh_timer.start(2000)
 
         logger.info("VideoStreamView initialized with debug mode ON")
 
@@ -169,8 +176,9 @@ class VideoStreamView(QWidget):
                 self.fps = 1.0 / dt
             self.last_frame_time = now
 
-            # Store original frame (make copy to prevent reference issues)
-            self.frame = frame.copy()
+            # Store the frame as-is: the processing thread emits an
+            # owned copy per frame and never touches it again
+            self.frame = frame
 
             # Get frame dimensions
             h, w, c = frame.shape
@@ -196,9 +204,8 @@ class VideoStreamView(QWidget):
             logger.debug(f"Successfully updated frame {w}x{h}")
 
         except Exception as e:
-            import traceback
-            logger.error(f"Error in update_frame: {str(e)}")
-            logger.debug(traceback.format_exc())
+            # exc_info defers traceback formatting to the handler
+            logger.error(f"Error in update_frame: {str(e)}", exc_info=True)
             self.frame_stats["errors"] += 1
             self.frame_stats["last_error"] = str(e)
             self.update_debug_info()
@@ -210,49 +217,64 @@ class VideoStreamView(QWidget):
                 logger.warning("No frame to convert to pixmap")
                 return
 
-            # Make a copy of the frame
-            disp_frame = self.frame.copy()
-
-            # Draw information overlay if enabled
-            if self.show_info:
+            # Draw overlays into a persistent canvas instead of a fresh
+            # copy per frame; only reallocate on resolution change
+            if self.show_info and (self.source_info or self.show_grid):
+                if (self._display_buf is None
+                        or self._display_buf.shape != self.frame.shape):
+                    self._display_buf = np.empty_like(self.frame)
+                np.copyto(self._display_buf, self.frame)
+                disp_frame = self._display_buf
                 self.draw_info_overlay(disp_frame)
-
-            # Convert BGR to RGB for Qt
-            rgb_frame = cv2.cvtColor(disp_frame, cv2.COLOR_BGR2RGB)
-
-            # Get frame dimensions
-            h, w, c = rgb_frame.shape
-            bytes_per_line = c * w
-
-            # Create QImage with explicit copy of data
-            q_img = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
-
-            # Scale image to fit widget if needed
-            pixmap = QPixmap.fromImage(q_img)
-
-            # Adjust pixmap size to fit the widget while maintaining aspect ratio
+            else:
+                disp_frame = self.frame
+
+            # QImage needs a contiguous buffer; frames straight from
+            # OpenCV already are, so this is normally free
+            if not disp_frame.flags["C_CONTIGUOUS"]:
+                disp_frame = np.ascontiguousarray(disp_frame)
+
+            # Scale to the widget with OpenCV before Qt sees the frame:
+            # INTER_AREA on the uint8 ndarray is far cheaper than Qt's
+            # SmoothTransformation on a full-resolution pixmap, and the
+            # destination buffer is reused across frames
             widget_size = self.frame_widget.size()
-            scaled_pixmap = pixmap.scaled(
-                widget_size,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+            h, w = disp_frame.shape[:2]
+            scale = min(widget_size.width() / w, widget_size.height() / h)
+            target = (max(1, int(w * scale)), max(1, int(h * scale)))
+            if target != (w, h):
+                if (self._resize_buf is None
+                        or self._resize_buf.shape[:2] != (target[1], target[0])):
+                    self._resize_buf = np.empty(
+                        (target[1], target[0], 3), np.uint8)
+                cv2.resize(disp_frame, target, dst=self._resize_buf,
+                           interpolation=cv2.INTER_AREA)
+                disp_frame = self._resize_buf
+
+            # Pack into 32-bit BGRX, the layout QPixmap stores natively,
+            # so the fromImage below is a plain memcpy instead of a
+            # scanline repack; the pad buffer is reused across frames
+            h, w = disp_frame.shape[:2]
+            if self._bgrx is None or self._bgrx.shape[:2] != (h, w):
+                self._bgrx = np.empty((h, w, 4), np.uint8)
+            cv2.cvtColor(disp_frame, cv2.COLOR_BGR2BGRA, dst=self._bgrx)
+            q_img = QImage(self._bgrx.data, w, h, w * 4,
+                           QImage.Format_RGB32)
+            self._qimage_backing = self._bgrx
+
+            # Already at widget size; no further Qt-side scaling
+            scaled_pixmap = QPixmap.fromImage(q_img)
 
             self.scaled_frame = scaled_pixmap
 
-            # Display image
+            # Display image; setPixmap schedules the repaint itself, so
+            # no forced update or event-loop re-entry is needed here
             self.frame_widget.setPixmap(scaled_pixmap)
-
-            # Force immediate update
-            self.frame_widget.update()
-
-            # Ensure widget repaints immediately
-            QApplication.processEvents()
+            self._pixmap_set = True
 
         except Exception as e:
-            import traceback
-            logger.error(f"Error converting frame to pixmap: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.error(f"Error converting frame to pixmap: {str(e)}",
+                         exc_info=True)
             self.frame_stats["errors"] += 1
             self.frame_stats["last_error"] = f"Pixmap: {str(e)}"
             self.update_debug_info()
@@ -271,8 +293,9 @@ class VideoStreamView(QWidget):
 
     def is_frame_displayed(self):
         """Check if frame is being displayed"""
-        # Check if pixmap is set on the label
-        return self.frame_widget.pixmap() is not None
+        # Tracked with a flag: QLabel.pixmap() can return a copy of the
+        # pixmap on some Qt versions, which this accessor must not pay
+        return self._pixmap_set
 
     def update_debug_info(self):
         """Update debug information display"""
@@ -319,29 +342,34 @@ class VideoStreamView(QWidget):
 
             # Draw source info
             if self.source_info:
-                y_pos = 30
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = 0.6
-                color = (255, 255, 255)
-                thickness = 1
-
-                # Draw black background
                 info_text = f"Source: {self.source_info.get('source_path', 'Unknown')}"
-                (text_w, text_h), _ = cv2.getTextSize(info_text, font, font_scale, thickness)
-                cv2.rectangle(frame, (10, y_pos - text_h - 5), (10 + text_w + 10, y_pos + 5), (0, 0, 0), -1)
-
-                # Draw text
-                cv2.putText(frame, info_text, (15, y_pos), font, font_scale, color, thickness)
 
-            # Draw grid if enabled
+                # Render the banner (black box + text) once per source; the
+                # per-frame cost is then a single rectangular slice copy
+                if self._info_sprite_key != info_text:
+                    font = cv2.FONT_HERSHEY_SIMPLEX
+                    font_scale = 0.6
+                    thickness = 1
+                    (text_w, text_h), _ = cv2.getTextSize(
+                        info_text, font, font_scale, thickness)
+                    sprite = np.zeros((text_h + 10, text_w + 10, 3), np.uint8)
+                    cv2.putText(sprite, info_text, (5, text_h + 5), font,
+                                font_scale, (255, 255, 255), thickness)
+                    self._info_sprite = sprite
+                    self._info_sprite_key = info_text
+
+                sprite = self._info_sprite
+                sh, sw = sprite.shape[:2]
+                y0 = max(0, 35 - sh)
+                y1 = min(y0 + sh, h)
+                x1 = min(10 + sw, w)
+                frame[y0:y1, 10:x1] = sprite[:y1 - y0, :x1 - 10]
+
+            # Draw grid if enabled: two strided numpy writes touch only the
+            # grid pixels themselves, cheaper than any full-frame pass
             if self.show_grid:
-                # Draw vertical lines
-                for x in range(0, w, 100):
-                    cv2.line(frame, (x, 0), (x, h), (40, 40, 40), 1)
-
-                # Draw horizontal lines
-                for y in range(0, h, 100):
-                    cv2.line(frame, (0, y), (w, y), (40, 40, 40), 1)
+                frame[::100, :] = (40, 40, 40)
+                frame[:, ::100] = (40, 40, 40)
 
         except Exception as e:
             logger.error(f"Error drawing info overlay: {str(e)}")
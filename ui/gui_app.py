@@ -6,22 +6,26 @@ GUI application for Vehicle Counter
 """
 
 import numpy as np
-import time
 import logging
 import traceback
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
 
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout,
                              QFileDialog, QMessageBox, QDockWidget, QApplication
                              )
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, QThread, pyqtSignal, QMutex, QMutexLocker
+from PyQt5.QtCore import (
+    Qt, pyqtSlot, QThread, pyqtSignal, QMutex, QMutexLocker,
+    QWaitCondition
+)
 
 # Import core components
-from core.detector import VehicleDetector
+from core.detector import VehicleDetector, resolve_model_path
 from core.tracker import VehicleTracker
 from core.counter import VehicleCounter
 from core.roi_manager import ROIManager
+from core.tracking_kernels import warmup_kernels
 from utils.video_sources import create_video_source, VideoSource
 from config.settings import (
     MODELS_DIR, DEFAULT_MODEL, DEFAULT_CONF_THRESHOLD, DEFAULT_NMS_THRESHOLD,
@@ -37,7 +41,9 @@ logger = logging.getLogger(__name__)
 
 class ProcessingThread(QThread):
     """Thread for processing video frames"""
-    frame_processed = pyqtSignal(np.ndarray, dict)
+    # Zero-payload notification; consumers pop the frame via
+    # take_latest(), so the Qt event queue never carries ndarrays
+    frame_ready = pyqtSignal()
     processing_finished = pyqtSignal()
     error_occurred = pyqtSignal(str)
 
@@ -55,6 +61,27 @@ class ProcessingThread(QThread):
         # Add mutex for thread safety
         self._mutex = QMutex()
 
+        # Wait condition so pause idles the thread completely and
+        # resume/stop wake it immediately instead of on a poll tick
+        self._pause_cond = QWaitCondition()
+
+        # Single-slot handoff to the UI: holds the newest unconsumed
+        # (frame, results); an unconsumed frame is simply replaced
+        self._latest = None
+
+        # Frames whose inference is in flight, oldest first; matched
+        # one-to-one with the detector's request pool
+        self._pending_frames = deque()
+
+        # Results dict reused across frames to avoid per-frame dict
+        # churn; only the key values are replaced (see _finish_frame)
+        self._results = {
+            "detection": None,
+            "tracking": None,
+            "counting": None,
+            "performance": None
+        }
+
     def run(self):
         """Main processing loop"""
         self.running = True
@@ -103,10 +130,11 @@ class ProcessingThread(QThread):
         return True, first_frame
 
     def _start_initial_detection(self, frame: np.ndarray):
-        """Start initial detection if using async mode"""
+        """Prime the async inference pipeline with the first frame"""
         if hasattr(self.detector, 'is_async') and self.detector.is_async:
             try:
-                self.detector.detect(frame)
+                self.detector.submit(frame)
+                self._pending_frames.append(frame)
             except Exception as detect_error:
                 self.error_occurred.emit(f"Error during initial detection: {str(detect_error)}")
                 raise
@@ -116,6 +144,13 @@ class ProcessingThread(QThread):
         frame_count = 0
         logger.info("Starting frame processing loop")
 
+        # In async mode the loop keeps the detector's request pool full:
+        # frame N is submitted before the oldest in-flight result is
+        # consumed, so device inference overlaps tracking and drawing.
+        # Each result is matched back to the frame it was computed on.
+        use_async = bool(getattr(self.detector, "is_async", False))
+        depth = self.detector.num_requests if use_async else 0
+
         while self.running:
             # Check if paused
             if self._check_if_paused():
@@ -139,7 +174,19 @@ class ProcessingThread(QThread):
 
             # Process current frame
             try:
-                self._process_single_frame(frame, frame_count)
+                if use_async:
+                    self.detector.submit(frame)
+                    self._pending_frames.append(frame)
+
+                    # Fill the pipeline before consuming results
+                    if len(self._pending_frames) < depth:
+                        continue
+
+                    done_frame = self._pending_frames.popleft()
+                    detections, infer_time = self.detector.poll()
+                    self._finish_frame(done_frame, detections, frame_count)
+                else:
+                    self._process_single_frame(frame, frame_count)
                 frame_count += 1
             except Exception as e:
                 logger.error(f"Error processing frame {frame_count}: {str(e)}")
@@ -147,26 +194,38 @@ class ProcessingThread(QThread):
                 # Continue processing next frame instead of breaking
                 continue
 
+        # Drain results still in flight so the shared detector's
+        # request pool is empty for the next run. This runs on a user
+        # stop too — it is bounded at num_requests polls — but the
+        # results are only displayed when the stream ended naturally
+        while use_async and self._pending_frames:
+            try:
+                done_frame = self._pending_frames.popleft()
+                detections, infer_time = self.detector.poll()
+                if self.running:
+                    self._finish_frame(done_frame, detections, frame_count)
+                    frame_count += 1
+            except Exception as e:
+                logger.error(f"Error draining frame {frame_count}: {str(e)}")
+                break
+
         logger.info(f"Frame processing loop ended after {frame_count} frames")
         self.processing_finished.emit()
 
 
     def _check_if_paused(self) -> bool:
-        """Check if processing is paused"""
+        """Block while paused; returns True if a pause was waited out"""
         with QMutexLocker(self._mutex):
-            paused = self.paused
+            if not self.paused:
+                return False
 
-        if paused:
-            # Do not consume CPU when paused
-            time.sleep(0.1)
-            return True
-        return False
+            # Zero CPU while paused; resume() or stop() wakes us
+            while self.paused and self.running:
+                self._pause_cond.wait(self._mutex)
+        return True
 
     def _process_single_frame(self, frame: np.ndarray, frame_count: int):
-        """Process a single video frame"""
-        # Make a deep copy for drawing to avoid reference issues
-        vis_frame = frame.copy()
-
+        """Process a single video frame synchronously"""
         # Run detection
         results = self._run_detection(frame)
         if results is None:
@@ -174,14 +233,19 @@ class ProcessingThread(QThread):
             return
 
         detections, infer_time = results
+        self._finish_frame(frame, detections, frame_count)
 
-        # Skip if no detections available yet (first frame in async mode)
+    def _finish_frame(self, frame: np.ndarray, detections, frame_count: int):
+        """Track, count, draw and publish one frame with its detections"""
         if detections is None:
             logger.debug(f"Skipping frame {frame_count} - no detections available yet")
             return
 
-        # Process detections and update tracking
-        processed_frame, detection_results = self.detector.postprocess(vis_frame, detections)
+        # Process detections and update tracking; drawing happens
+        # directly on the frame — source.read() hands us an owned
+        # buffer and the detector packed its input blob in preprocess,
+        # so nothing else references these pixels
+        processed_frame, detection_results = self.detector.postprocess(frame, detections)
 
         # Update tracker
         if not detection_results or "boxes" not in detection_results:
@@ -201,24 +265,39 @@ class ProcessingThread(QThread):
         # Draw visualizations
         processed_frame = self._draw_visualization(processed_frame)
 
-        # Combine all results
-        results = {
-            "detection": detection_results,
-            "tracking": tracking_results,
-            "counting": counting_results,
-            "performance": self.detector.get_performance_stats()
-        }
+        # Combine all results into the reused dict. The nested result
+        # dicts are fresh objects from the detector/tracker/counter
+        # each frame and key assignment is atomic, so a consumer
+        # reading concurrently can at worst see values from adjacent
+        # frames — the same granularity the drop-oldest handoff
+        # already delivers
+        results = self._results
+        results["detection"] = detection_results
+        results["tracking"] = tracking_results
+        results["counting"] = counting_results
+        # Rolling averages change slowly; refresh the performance
+        # labels every 10 frames (~3 Hz) instead of at frame rate
+        results["performance"] = (self.detector.get_performance_stats()
+                                  if frame_count % 10 == 0 else None)
 
         # Log untuk debugging
         if frame_count % 30 == 0:
             logger.debug(f"Emitting processed frame #{frame_count}, shape: {processed_frame.shape}")
 
-        # Emit processed frame - this is where Qt signal emission happens
+        # Publish the frame through the single-slot handoff. No copy:
+        # this thread never touches the frame again (the next iteration
+        # reads a fresh buffer from the source). If the UI is behind,
+        # the newer frame replaces the unconsumed one — drop-oldest —
+        # and the notification already in flight covers it, so the Qt
+        # event queue stays bounded at one pending event
         try:
-            frame_copy = processed_frame.copy()
-            self.frame_processed.emit(frame_copy, results)
+            with QMutexLocker(self._mutex):
+                had_pending = self._latest is not None
+                self._latest = (processed_frame, results)
+            if not had_pending:
+                self.frame_ready.emit()
         except Exception as e:
-            logger.error(f"Error emitting processed frame: {str(e)}")
+            logger.error(f"Error publishing processed frame: {str(e)}")
             logger.debug(traceback.format_exc())
 
     def _run_detection(self, frame: np.ndarray) -> Optional[Tuple[np.ndarray, float]]:
@@ -271,9 +350,26 @@ class ProcessingThread(QThread):
         logger.debug(traceback.format_exc())
         self.error_occurred.emit(error_msg)
 
+    def take_latest(self):
+        """Pop the most recent processed (frame, results), if any
+
+        Returns:
+            tuple: (frame, results), or None when already consumed
+        """
+        with QMutexLocker(self._mutex):
+            latest = self._latest
+            self._latest = None
+        return latest
+
     def stop(self):
         """Stop processing thread safely"""
-        self.running = False
+        # Clear the flag and wake under the mutex so the wake cannot
+        # slip between a paused worker's condition check and its wait()
+        with QMutexLocker(self._mutex):
+            if not self.running:
+                return
+            self.running = False
+            self._pause_cond.wakeAll()
         # Don't wait here - calling thread will wait if needed
 
     def pause(self):
@@ -285,6 +381,7 @@ class ProcessingThread(QThread):
         """Resume processing"""
         with QMutexLocker(self._mutex):
             self.paused = False
+        self._pause_cond.wakeAll()
 
 
 class VehicleCounterGUI(QMainWindow):
@@ -340,11 +437,6 @@ class VehicleCounterGUI(QMainWindow):
         # Connect control panel signals
         self.connect_signals()
 
-        # Timer for updating UI
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_ui)
-        self.timer.start(100)  # Update every 100ms
-
     def init_components(self):
         """Initialize core components"""
         try:
@@ -353,11 +445,12 @@ class VehicleCounterGUI(QMainWindow):
 
             # 2. Create the detector
             self.detector = VehicleDetector(
-                model_path=DEFAULT_MODEL,
+                model_path=resolve_model_path(DEFAULT_MODEL),
                 device="GPU",
                 conf_threshold=DEFAULT_CONF_THRESHOLD,
                 nms_threshold=DEFAULT_NMS_THRESHOLD,
-                async_mode=True
+                async_mode=True,
+                num_requests=3
             )
 
             # 3. Create the tracker
@@ -377,6 +470,10 @@ class VehicleCounterGUI(QMainWindow):
                 self.roi_manager
             )
 
+            # 7. Compile the tracking/counting kernels now so the first
+            # real frame doesn't pay the JIT cost
+            warmup_kernels()
+
         except Exception as e:
             self._handle_component_init_error(e)
 
@@ -419,16 +516,6 @@ class VehicleCounterGUI(QMainWindow):
             logger.debug(traceback.format_exc())
             QMessageBox.critical(self, "Error", f"Failed to connect signals: {str(e)}")
 
-    def update_ui(self):
-        """Update UI components"""
-        # Update status if processing thread is running
-        if self.processing_thread and self.processing_thread.isRunning():
-            self.control_panel.update_status("Processing")
-            self.processing_active = True
-        else:
-            self.control_panel.update_status("Idle")
-            self.processing_active = False
-
     @pyqtSlot(str, str, dict)
     def change_source(self, source_type: str, source_path: str, options: Dict[str, Any]):
         """Change video source"""
@@ -493,7 +580,7 @@ class VehicleCounterGUI(QMainWindow):
         if self.processing_thread is not None:
             # Disconnect all signals safely to prevent memory leaks and recursive calls
             try:
-                self.processing_thread.frame_processed.disconnect()
+                self.processing_thread.frame_ready.disconnect()
                 self.processing_thread.processing_finished.disconnect()
                 self.processing_thread.error_occurred.disconnect()
             except (TypeError, RuntimeError) as e:
@@ -516,6 +603,10 @@ class VehicleCounterGUI(QMainWindow):
             self.tracker.reset()
         if self.counter:
             self.counter.reset()
+        # The detector instance is shared across runs; make sure no
+        # stale in-flight requests survive an aborted drain
+        if self.detector and hasattr(self.detector, 'reset_pipeline'):
+            self.detector.reset_pipeline()
 
     def connect_thread_signals(self):
         """Connect processing thread signals"""
@@ -523,11 +614,11 @@ class VehicleCounterGUI(QMainWindow):
 
         try:
             # Connect using QueuedConnection for thread safety
-            self.processing_thread.frame_processed.connect(
-                self.on_frame_processed,
+            self.processing_thread.frame_ready.connect(
+                self.on_frame_ready,
                 type=Qt.QueuedConnection
             )
-            logger.info("Connected frame_processed signal")
+            logger.info("Connected frame_ready signal")
 
             self.processing_thread.processing_finished.connect(
                 self.on_processing_finished,
@@ -559,15 +650,17 @@ class VehicleCounterGUI(QMainWindow):
             self.processing_thread = None
             self.processing_active = False
 
-    @pyqtSlot(np.ndarray, dict)
-    def on_frame_processed(self, frame: np.ndarray, results: Dict[str, Any]):
-        """Handle processed frame"""
+    @pyqtSlot()
+    def on_frame_ready(self):
+        """Display the newest processed frame from the handoff slot"""
         try:
-            logger.debug(f"Received frame, shape: {frame.shape if frame is not None else 'None'}")
+            if self.processing_thread is None:
+                return
 
-            if frame is None:
-                logger.error("Received None frame in on_frame_processed")
+            latest = self.processing_thread.take_latest()
+            if latest is None:
                 return
+            frame, results = latest
 
             # Update stream view directly without copying again
             self.stream_view.update_frame(frame)
@@ -575,7 +668,7 @@ class VehicleCounterGUI(QMainWindow):
             # Update statistics
             self.control_panel.update_statistics(results)
         except Exception as e:
-            logger.error(f"Error in on_frame_processed: {str(e)}")
+            logger.error(f"Error in on_frame_ready: {str(e)}")
             logger.debug(traceback.format_exc())
 
     @pyqtSlot()
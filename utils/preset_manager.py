@@ -13,9 +13,77 @@ from pathlib import Path
 from datetime import datetime
 from config.settings import PRESETS_DIR
 
+# orjson parses/serializes several times faster than stdlib json; fall
+# back silently when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _load_json(path):
+    """Parse a JSON file with the fastest available parser
+
+    Args:
+        path: File path
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _dump_json(data, path):
+    """Write data to a JSON file, indented, with the fastest serializer
+
+    Args:
+        data: JSON-serializable data
+        path: File path
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
+def _path_inode(path):
+    """Get a file's (device, inode) identity tuple
+
+    Args:
+        path: File path
+
+    Returns:
+        tuple: (st_dev, st_ino), or None if the file cannot be stat'ed
+    """
+    try:
+        stat = os.stat(path)
+        return (stat.st_dev, stat.st_ino)
+    except OSError:
+        return None
+
+def _format_timestamp(value, default="Unknown"):
+    """Format an ISO timestamp for display
+
+    Args:
+        value (str): ISO datetime string
+        default (str): Fallback when value is empty
+
+    Returns:
+        str: Human-readable timestamp
+    """
+    if not value:
+        return default
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return value
+
 class PresetManager:
     """
     Manages saving, loading, and validation of configuration presets
@@ -36,6 +104,10 @@ class PresetManager:
         # Cached presets
         self.presets = {}
 
+        # Metadata cache: path -> ((mtime_ns, size), preset_id, info)
+        # so rescans only re-parse files whose stat signature changed
+        self._meta_cache = {}
+
         # Current preset
         self.current_preset = None
         self.current_preset_path = None
@@ -50,26 +122,61 @@ class PresetManager:
         Returns:
             dict: Preset information {id: {name, path, created}}
         """
-        self.presets = {}
+        presets = {}
+        seen_paths = set()
+
+        # Scan preset directory once; only parse new or changed files
+        try:
+            entries = [entry for entry in os.scandir(self.presets_dir)
+                       if entry.name.endswith(".json")]
+        except OSError as e:
+            logger.error(f"Error scanning presets directory {self.presets_dir}: {str(e)}")
+            entries = []
+
+        for entry in entries:
+            file_path = entry.path
+            seen_paths.add(file_path)
 
-        # Scan preset directory
-        for file_path in self.presets_dir.glob("*.json"):
             try:
-                # Load basic info without full preset data
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-
-                preset_id = data.get("id", str(uuid.uuid4()))
-                self.presets[preset_id] = {
-                    "id": preset_id,
-                    "name": data.get("name", file_path.stem),
-                    "path": str(file_path),
-                    "created": data.get("created", datetime.now().isoformat()),
-                    "description": data.get("description", "")
-                }
+                stat = entry.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+
+                cached = self._meta_cache.get(file_path)
+                if cached is not None and cached[0] == signature:
+                    preset_id, info = cached[1], cached[2]
+                else:
+                    # Load basic info without full preset data
+                    data = _load_json(file_path)
+
+                    preset_id = data.get("id", str(uuid.uuid4()))
+                    created = data.get("created", datetime.now().isoformat())
+                    modified = data.get("modified", created)
+                    info = {
+                        "id": preset_id,
+                        "name": data.get("name", Path(file_path).stem),
+                        "path": file_path,
+                        "inode": (stat.st_dev, stat.st_ino),
+                        "created": created,
+                        "modified": modified,
+                        # Display strings are rendered once here so the
+                        # UI never parses datetimes per selection
+                        "created_display": _format_timestamp(created),
+                        "modified_display": _format_timestamp(modified),
+                        "description": data.get("description", "")
+                    }
+                    self._meta_cache[file_path] = (signature, preset_id, info)
+
+                presets[preset_id] = info
             except Exception as e:
                 logger.error(f"Error loading preset info from {file_path}: {str(e)}")
 
+        # Drop cache entries for files that no longer exist
+        for file_path in list(self._meta_cache):
+            if file_path not in seen_paths:
+                del self._meta_cache[file_path]
+
+        self.presets = presets
+
         logger.info(f"Loaded information for {len(self.presets)} presets")
         return self.presets
 
@@ -151,8 +258,7 @@ class PresetManager:
             return None
 
         try:
-            with open(path_to_load, 'r') as f:
-                preset = json.load(f)
+            preset = _load_json(path_to_load)
 
             # Validate preset
             if not self._validate_preset(preset):
@@ -198,8 +304,7 @@ class PresetManager:
             preset["modified"] = datetime.now().isoformat()
 
             # Save to file
-            with open(path, 'w') as f:
-                json.dump(preset, f, indent=2)
+            _dump_json(preset, path)
 
             # Update current preset if requested
             if update_current:
@@ -211,7 +316,11 @@ class PresetManager:
                 "id": preset["id"],
                 "name": preset.get("name", "Unnamed"),
                 "path": str(path),
+                "inode": _path_inode(path),
                 "created": preset.get("created"),
+                "modified": preset["modified"],
+                "created_display": _format_timestamp(preset.get("created")),
+                "modified_display": _format_timestamp(preset["modified"]),
                 "description": preset.get("description", "")
             }
 
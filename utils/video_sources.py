@@ -6,11 +6,15 @@ Video source management for the Vehicle Counter application
 Handles various video sources (RTSP, webcam, file)
 """
 
+import os
 import cv2
 import time
+import shutil
 import threading
 import queue
+import numpy as np
 from enum import Enum
+from pathlib import Path
 
 class SourceType(Enum):
     """Enum for video source types"""
@@ -233,6 +237,199 @@ class FileVideoSource(VideoSource):
                 self.frame_buffer.put(frame)  # Add new frame
 
 
+# Refuse to build frame caches larger than this; raw BGR frames add
+# up fast (a second of 1080p30 is roughly 170 MB)
+FRAME_CACHE_MAX_BYTES = 4 * 1024 ** 3
+
+
+class FrameCacheSource(FileVideoSource):
+    """Video file source backed by a disk cache of decoded frames
+
+    During the first run the file plays back normally while a worker
+    thread decodes it once into a memory-mapped .npy next to the
+    video. Subsequent opens replay frames straight from the cache,
+    replacing per-frame codec work with a page-cache copy. Useful when
+    the same clip is replayed repeatedly, e.g. while tuning ROIs and
+    counting lines or benchmarking presets.
+    """
+    def __init__(self, file_path, loop=False, buffer_size=10):
+        """
+        Initialize frame cache source
+
+        Args:
+            file_path (str): Path to video file
+            loop (bool): Whether to loop video
+            buffer_size (int): Size of frame buffer (used only when
+                falling back to normal decoding)
+        """
+        super().__init__(file_path, loop=loop, buffer_size=buffer_size)
+        self._cached_frames = None
+        self._read_index = 0
+        self._build_thread = None
+        self._build_running = False
+
+    def _cache_path(self):
+        """Get cache file path keyed by the video's size and mtime"""
+        base = Path(self.source_path)
+        try:
+            stat = os.stat(self.source_path)
+            key = f"{stat.st_size}_{stat.st_mtime_ns}"
+        except OSError:
+            key = "0"
+        return base.with_name(f"{base.stem}.{key}.framecache.npy")
+
+    def open(self):
+        """Open the frame cache, building it on first use"""
+        cache_path = self._cache_path()
+
+        if cache_path.exists():
+            try:
+                self._cached_frames = np.load(str(cache_path), mmap_mode="r")
+                _, self.frame_height, self.frame_width = self._cached_frames.shape[:3]
+
+                # FPS is not stored in the cache, probe the container
+                cap = cv2.VideoCapture(self.source_path)
+                self.fps = cap.get(cv2.CAP_PROP_FPS)
+                cap.release()
+
+                self.is_opened = True
+                self._read_index = 0
+                print(f"Frame cache opened: {cache_path} "
+                      f"({len(self._cached_frames)} frames)")
+                return True
+            except Exception as e:
+                print(f"Error opening frame cache: {str(e)}")
+                self._cached_frames = None
+
+        if not super().open():
+            return False
+
+        self._start_cache_build(cache_path)
+        return True
+
+    def _cleanup_stale_caches(self, keep_path):
+        """Remove caches left behind by older versions of the video"""
+        base = Path(self.source_path)
+        for stale in base.parent.glob(f"{base.stem}.*.framecache.npy*"):
+            if stale == keep_path:
+                continue
+            try:
+                stale.unlink()
+                print(f"Removed stale frame cache: {stale}")
+            except OSError:
+                pass
+
+    def _start_cache_build(self, cache_path):
+        """Start building the cache on a worker thread
+
+        Playback keeps decoding normally during the first run; the
+        finished cache is picked up by the next open().
+        """
+        total = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if total <= 0:
+            # Length unknown, keep decoding normally
+            print("Frame count unknown, caching disabled for this file")
+            return
+
+        estimate = total * self.frame_height * self.frame_width * 3
+        free = shutil.disk_usage(str(cache_path.parent)).free
+        if estimate > FRAME_CACHE_MAX_BYTES or estimate > free // 2:
+            print(f"Frame cache would need {estimate / 1024 ** 2:.0f} MB, "
+                  "caching disabled for this file")
+            return
+
+        self._cleanup_stale_caches(cache_path)
+
+        self._build_running = True
+        self._build_thread = threading.Thread(
+            target=self._build_cache, args=(cache_path, total), daemon=True)
+        self._build_thread.start()
+
+    def _build_cache(self, cache_path, total):
+        """Thread function decoding the whole file into the cache
+
+        Uses its own capture so the playback path is untouched. The
+        cache is written to a .partial file and only renamed into
+        place once complete, so an interrupted build is never mistaken
+        for a valid cache.
+        """
+        partial_path = cache_path.with_name(cache_path.name + ".partial")
+        cap = cv2.VideoCapture(self.source_path)
+        try:
+            print(f"Building frame cache ({total} frames): {cache_path}")
+            cache = np.lib.format.open_memmap(
+                str(partial_path), mode="w+", dtype=np.uint8,
+                shape=(total, self.frame_height, self.frame_width, 3))
+
+            written = 0
+            while written < total and self._build_running:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                cache[written] = frame
+                written += 1
+
+            cache.flush()
+            del cache
+
+            if not self._build_running:
+                # Source released mid-build, drop the partial file
+                partial_path.unlink()
+                return
+
+            if written == total:
+                partial_path.rename(cache_path)
+            else:
+                # Container over-reported its length, write a trimmed copy
+                trimmed = np.load(str(partial_path), mmap_mode="r")
+                np.save(str(cache_path), trimmed[:written])
+                del trimmed
+                partial_path.unlink()
+            print(f"Frame cache built: {written} frames")
+        except Exception as e:
+            # Cache build failed (e.g. disk full), decode normally
+            print(f"Error building frame cache: {str(e)}")
+            try:
+                partial_path.unlink()
+            except OSError:
+                pass
+        finally:
+            cap.release()
+            self._build_running = False
+
+    def read(self):
+        """
+        Read next frame from the cache
+
+        Returns:
+            tuple: (success, frame)
+        """
+        if self._cached_frames is None:
+            # No cache available, behave like a normal file source
+            return super().read()
+
+        if self._read_index >= len(self._cached_frames):
+            if not self.loop:
+                return False, None
+            self._read_index = 0
+
+        # Copy out of the read-only mapping since downstream draws on frames
+        frame = np.array(self._cached_frames[self._read_index])
+        self._read_index += 1
+        self.frame_count += 1
+        return True, frame
+
+    def release(self):
+        """Release resources, stopping any cache build in progress"""
+        self._build_running = False
+        if self._build_thread is not None:
+            self._build_thread.join(timeout=1.0)
+            self._build_thread = None
+        super().release()
+        self._cached_frames = None
+        self._read_index = 0
+
+
 class RTSPVideoSource(VideoSource):
     """RTSP video source with reconnection logic"""
     def __init__(self, rtsp_url, reconnect_interval=5, buffer_size=10):
@@ -336,6 +533,10 @@ def create_video_source(source_type, source_path, **kwargs):
         VideoSource: Initialized video source
     """
     if source_type.lower() == 'file':
+        if kwargs.get('cache_frames', False):
+            return FrameCacheSource(source_path,
+                                    loop=kwargs.get('loop', False),
+                                    buffer_size=kwargs.get('buffer_size', 10))
         return FileVideoSource(source_path,
                                loop=kwargs.get('loop', False),
                                buffer_size=kwargs.get('buffer_size', 10))